@@ -3,250 +3,379 @@ Career Recommendation Agent
 Provides personalized career path suggestions based on user profile and market analysis
 """
 
+import heapq
 import json
-from typing import Dict, List, Optional
+import re
+from collections import namedtuple
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 
-class CareerRecommenderAgent:
-    def __init__(self):
-        # Career paths database with progression information
-        self.career_paths = {
-            'Software Development': {
-                'paths': [
-                    {
-                        'title': 'Senior Full Stack Developer',
-                        'description': 'Build end-to-end applications with modern frameworks and cloud technologies.',
-                        'current_skills_needed': ['JavaScript', 'Python', 'React', 'Node.js'],
-                        'skills_to_develop': ['AWS', 'Docker', 'GraphQL', 'TypeScript'],
-                        'timeline': '6-12 months with focused learning',
-                        'salary_range': '$120k - $180k',
-                        'icon': 'code',
-                        'growth_potential': 'High',
-                        'market_demand': 90,
-                        'difficulty': 'Medium'
-                    },
-                    {
-                        'title': 'Frontend Architect',
-                        'description': 'Design and lead frontend architecture decisions for large-scale applications.',
-                        'current_skills_needed': ['JavaScript', 'React', 'Vue.js', 'Angular'],
-                        'skills_to_develop': ['Micro-frontends', 'Performance Optimization', 'Design Systems'],
-                        'timeline': '8-15 months with leadership experience',
-                        'salary_range': '$130k - $200k',
-                        'icon': 'palette',
-                        'growth_potential': 'High',
-                        'market_demand': 75,
-                        'difficulty': 'High'
-                    },
-                    {
-                        'title': 'Backend Engineer',
-                        'description': 'Focus on server-side architecture, APIs, and system scalability.',
-                        'current_skills_needed': ['Python', 'Node.js', 'SQL', 'REST APIs'],
-                        'skills_to_develop': ['Microservices', 'Database Design', 'System Architecture'],
-                        'timeline': '4-10 months with system design focus',
-                        'salary_range': '$115k - $170k',
-                        'icon': 'server',
-                        'growth_potential': 'High',
-                        'market_demand': 85,
-                        'difficulty': 'Medium'
-                    }
-                ]
+try:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        """Pretty-print obj as JSON using the orjson C encoder"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Pretty-print obj as JSON using the stdlib encoder"""
+        return json.dumps(obj, indent=2, default=str)
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _thaw(value):
+    """Inverse of _freeze: rebuild plain dicts and lists so callers get a private copy"""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+# Career paths database with progression information.
+# Built once at import time and shared (read-only) by every agent instance.
+_CAREER_PATHS = _freeze({
+    'Software Development': {
+        'paths': [
+            {
+                'title': 'Senior Full Stack Developer',
+                'description': 'Build end-to-end applications with modern frameworks and cloud technologies.',
+                'current_skills_needed': ['JavaScript', 'Python', 'React', 'Node.js'],
+                'skills_to_develop': ['AWS', 'Docker', 'GraphQL', 'TypeScript'],
+                'timeline': '6-12 months with focused learning',
+                'salary_range': '$120k - $180k',
+                'icon': 'code',
+                'growth_potential': 'High',
+                'market_demand': 90,
+                'difficulty': 'Medium'
+            },
+            {
+                'title': 'Frontend Architect',
+                'description': 'Design and lead frontend architecture decisions for large-scale applications.',
+                'current_skills_needed': ['JavaScript', 'React', 'Vue.js', 'Angular'],
+                'skills_to_develop': ['Micro-frontends', 'Performance Optimization', 'Design Systems'],
+                'timeline': '8-15 months with leadership experience',
+                'salary_range': '$130k - $200k',
+                'icon': 'palette',
+                'growth_potential': 'High',
+                'market_demand': 75,
+                'difficulty': 'High'
             },
-            'Data Science': {
-                'paths': [
-                    {
-                        'title': 'Data Scientist',
-                        'description': 'Analyze data to drive business decisions using machine learning and statistical methods.',
-                        'current_skills_needed': ['Python', 'SQL', 'Statistics'],
-                        'skills_to_develop': ['Machine Learning', 'Deep Learning', 'Data Visualization', 'R'],
-                        'timeline': '12-18 months with intensive study',
-                        'salary_range': '$130k - $200k',
-                        'icon': 'chart-line',
-                        'growth_potential': 'Very High',
-                        'market_demand': 95,
-                        'difficulty': 'High'
-                    },
-                    {
-                        'title': 'Machine Learning Engineer',
-                        'description': 'Build and deploy machine learning models at scale in production environments.',
-                        'current_skills_needed': ['Python', 'Machine Learning', 'Statistics'],
-                        'skills_to_develop': ['MLOps', 'TensorFlow', 'PyTorch', 'Kubernetes'],
-                        'timeline': '10-16 months with ML focus',
-                        'salary_range': '$140k - $220k',
-                        'icon': 'brain',
-                        'growth_potential': 'Very High',
-                        'market_demand': 92,
-                        'difficulty': 'Very High'
-                    },
-                    {
-                        'title': 'Data Engineer',
-                        'description': 'Build and maintain data pipelines and infrastructure for data processing.',
-                        'current_skills_needed': ['Python', 'SQL', 'Data Processing'],
-                        'skills_to_develop': ['Apache Spark', 'Apache Kafka', 'Data Warehousing', 'ETL'],
-                        'timeline': '8-14 months with data infrastructure focus',
-                        'salary_range': '$125k - $190k',
-                        'icon': 'database',
-                        'growth_potential': 'High',
-                        'market_demand': 88,
-                        'difficulty': 'High'
-                    }
-                ]
+            {
+                'title': 'Backend Engineer',
+                'description': 'Focus on server-side architecture, APIs, and system scalability.',
+                'current_skills_needed': ['Python', 'Node.js', 'SQL', 'REST APIs'],
+                'skills_to_develop': ['Microservices', 'Database Design', 'System Architecture'],
+                'timeline': '4-10 months with system design focus',
+                'salary_range': '$115k - $170k',
+                'icon': 'server',
+                'growth_potential': 'High',
+                'market_demand': 85,
+                'difficulty': 'Medium'
+            }
+        ]
+    },
+    'Data Science': {
+        'paths': [
+            {
+                'title': 'Data Scientist',
+                'description': 'Analyze data to drive business decisions using machine learning and statistical methods.',
+                'current_skills_needed': ['Python', 'SQL', 'Statistics'],
+                'skills_to_develop': ['Machine Learning', 'Deep Learning', 'Data Visualization', 'R'],
+                'timeline': '12-18 months with intensive study',
+                'salary_range': '$130k - $200k',
+                'icon': 'chart-line',
+                'growth_potential': 'Very High',
+                'market_demand': 95,
+                'difficulty': 'High'
             },
-            'Cloud & DevOps': {
-                'paths': [
-                    {
-                        'title': 'Cloud Solutions Architect',
-                        'description': 'Design and implement scalable cloud infrastructure and solutions.',
-                        'current_skills_needed': ['Linux', 'Networking', 'Programming'],
-                        'skills_to_develop': ['AWS', 'Kubernetes', 'Terraform', 'Azure'],
-                        'timeline': '8-15 months with hands-on practice',
-                        'salary_range': '$140k - $220k',
-                        'icon': 'cloud',
-                        'growth_potential': 'Very High',
-                        'market_demand': 90,
-                        'difficulty': 'High'
-                    },
-                    {
-                        'title': 'DevOps Engineer',
-                        'description': 'Automate deployment pipelines and manage infrastructure as code.',
-                        'current_skills_needed': ['Linux', 'Scripting', 'Git'],
-                        'skills_to_develop': ['Docker', 'Kubernetes', 'Jenkins', 'Infrastructure as Code'],
-                        'timeline': '6-12 months with automation focus',
-                        'salary_range': '$120k - $180k',
-                        'icon': 'cog',
-                        'growth_potential': 'High',
-                        'market_demand': 85,
-                        'difficulty': 'Medium'
-                    },
-                    {
-                        'title': 'Site Reliability Engineer',
-                        'description': 'Ensure system reliability, performance, and scalability at large scale.',
-                        'current_skills_needed': ['Programming', 'System Administration', 'Monitoring'],
-                        'skills_to_develop': ['SRE Practices', 'Observability', 'Incident Management'],
-                        'timeline': '10-18 months with reliability focus',
-                        'salary_range': '$135k - $200k',
-                        'icon': 'shield-check',
-                        'growth_potential': 'High',
-                        'market_demand': 80,
-                        'difficulty': 'High'
-                    }
-                ]
+            {
+                'title': 'Machine Learning Engineer',
+                'description': 'Build and deploy machine learning models at scale in production environments.',
+                'current_skills_needed': ['Python', 'Machine Learning', 'Statistics'],
+                'skills_to_develop': ['MLOps', 'TensorFlow', 'PyTorch', 'Kubernetes'],
+                'timeline': '10-16 months with ML focus',
+                'salary_range': '$140k - $220k',
+                'icon': 'brain',
+                'growth_potential': 'Very High',
+                'market_demand': 92,
+                'difficulty': 'Very High'
             },
-            'Product & Management': {
-                'paths': [
-                    {
-                        'title': 'Technical Product Manager',
-                        'description': 'Bridge technical and business teams to deliver successful products.',
-                        'current_skills_needed': ['Technical Background', 'Communication', 'Analytics'],
-                        'skills_to_develop': ['Product Strategy', 'User Research', 'Agile Methodology'],
-                        'timeline': '6-12 months with business focus',
-                        'salary_range': '$130k - $190k',
-                        'icon': 'briefcase',
-                        'growth_potential': 'High',
-                        'market_demand': 82,
-                        'difficulty': 'Medium'
-                    },
-                    {
-                        'title': 'Engineering Manager',
-                        'description': 'Lead engineering teams while maintaining technical expertise.',
-                        'current_skills_needed': ['Programming', 'Team Experience', 'Communication'],
-                        'skills_to_develop': ['Leadership', 'People Management', 'Strategic Planning'],
-                        'timeline': '12-24 months with leadership development',
-                        'salary_range': '$150k - $230k',
-                        'icon': 'users',
-                        'growth_potential': 'Very High',
-                        'market_demand': 78,
-                        'difficulty': 'High'
-                    }
-                ]
+            {
+                'title': 'Data Engineer',
+                'description': 'Build and maintain data pipelines and infrastructure for data processing.',
+                'current_skills_needed': ['Python', 'SQL', 'Data Processing'],
+                'skills_to_develop': ['Apache Spark', 'Apache Kafka', 'Data Warehousing', 'ETL'],
+                'timeline': '8-14 months with data infrastructure focus',
+                'salary_range': '$125k - $190k',
+                'icon': 'database',
+                'growth_potential': 'High',
+                'market_demand': 88,
+                'difficulty': 'High'
             }
-        }
-        
-        # Industry growth trends
-        self.industry_trends = {
-            'AI/ML': {'growth_rate': 35, 'job_increase': 42},
-            'Cloud Computing': {'growth_rate': 25, 'job_increase': 30},
-            'Cybersecurity': {'growth_rate': 28, 'job_increase': 35},
-            'Web Development': {'growth_rate': 15, 'job_increase': 20},
-            'Mobile Development': {'growth_rate': 18, 'job_increase': 22},
-            'Data Engineering': {'growth_rate': 32, 'job_increase': 38}
-        }
+        ]
+    },
+    'Cloud & DevOps': {
+        'paths': [
+            {
+                'title': 'Cloud Solutions Architect',
+                'description': 'Design and implement scalable cloud infrastructure and solutions.',
+                'current_skills_needed': ['Linux', 'Networking', 'Programming'],
+                'skills_to_develop': ['AWS', 'Kubernetes', 'Terraform', 'Azure'],
+                'timeline': '8-15 months with hands-on practice',
+                'salary_range': '$140k - $220k',
+                'icon': 'cloud',
+                'growth_potential': 'Very High',
+                'market_demand': 90,
+                'difficulty': 'High'
+            },
+            {
+                'title': 'DevOps Engineer',
+                'description': 'Automate deployment pipelines and manage infrastructure as code.',
+                'current_skills_needed': ['Linux', 'Scripting', 'Git'],
+                'skills_to_develop': ['Docker', 'Kubernetes', 'Jenkins', 'Infrastructure as Code'],
+                'timeline': '6-12 months with automation focus',
+                'salary_range': '$120k - $180k',
+                'icon': 'cog',
+                'growth_potential': 'High',
+                'market_demand': 85,
+                'difficulty': 'Medium'
+            },
+            {
+                'title': 'Site Reliability Engineer',
+                'description': 'Ensure system reliability, performance, and scalability at large scale.',
+                'current_skills_needed': ['Programming', 'System Administration', 'Monitoring'],
+                'skills_to_develop': ['SRE Practices', 'Observability', 'Incident Management'],
+                'timeline': '10-18 months with reliability focus',
+                'salary_range': '$135k - $200k',
+                'icon': 'shield-check',
+                'growth_potential': 'High',
+                'market_demand': 80,
+                'difficulty': 'High'
+            }
+        ]
+    },
+    'Product & Management': {
+        'paths': [
+            {
+                'title': 'Technical Product Manager',
+                'description': 'Bridge technical and business teams to deliver successful products.',
+                'current_skills_needed': ['Technical Background', 'Communication', 'Analytics'],
+                'skills_to_develop': ['Product Strategy', 'User Research', 'Agile Methodology'],
+                'timeline': '6-12 months with business focus',
+                'salary_range': '$130k - $190k',
+                'icon': 'briefcase',
+                'growth_potential': 'High',
+                'market_demand': 82,
+                'difficulty': 'Medium'
+            },
+            {
+                'title': 'Engineering Manager',
+                'description': 'Lead engineering teams while maintaining technical expertise.',
+                'current_skills_needed': ['Programming', 'Team Experience', 'Communication'],
+                'skills_to_develop': ['Leadership', 'People Management', 'Strategic Planning'],
+                'timeline': '12-24 months with leadership development',
+                'salary_range': '$150k - $230k',
+                'icon': 'users',
+                'growth_potential': 'Very High',
+                'market_demand': 78,
+                'difficulty': 'High'
+            }
+        ]
+    }
+})
+
+# Needed skills per career path, keyed by path title, for C-level set intersection
+_NEEDED_SKILL_SETS = {
+    path['title']: frozenset(path['current_skills_needed'])
+    for domain in _CAREER_PATHS.values()
+    for path in domain['paths']
+}
+
+def _needed_skill_set(path: Dict) -> frozenset:
+    """Return the precomputed needed-skill set for a path, building it for unknown paths"""
+    needed = _NEEDED_SKILL_SETS.get(path.get('title'))
+    if needed is None:
+        needed = frozenset(path.get('current_skills_needed', ()))
+    return needed
+
+def _user_skill_set(user_profile: Dict) -> frozenset:
+    """Flatten the user's categorized skills into a single set"""
+    return frozenset(chain.from_iterable(user_profile.get('skill_categories', {}).values()))
+
+# Normalized view of the profile fields read by the scoring and explanation helpers
+_Profile = namedtuple('_Profile', 'skill_set exp_level')
+
+def _normalize_profile(user_profile: Union[Dict, _Profile]) -> _Profile:
+    """Resolve profile fields and defaults once, before any per-path work"""
+    if isinstance(user_profile, _Profile):
+        return user_profile
+    return _Profile(_user_skill_set(user_profile), user_profile.get('experience_level', 'Mid'))
+
+# Experience level keywords, matched as substrings anywhere in the string. Each
+# alternative is a lookahead anchored at the start, so the groups are tried in
+# priority order (entry, then mid, then senior) in a single compiled pattern.
+_EXPERIENCE_LEVEL_RE = re.compile(
+    r'(?=.*?(?P<entry>0|1 year|entry|junior|graduate))'
+    r'|(?=.*?(?P<mid>[234]|mid))'
+    r'|(?=.*?(?P<senior>[5-8]|senior))',
+    re.IGNORECASE | re.DOTALL
+)
+_EXPERIENCE_LEVELS = {'entry': 'Entry', 'mid': 'Mid', 'senior': 'Senior'}
+
+# Score adjustment for (experience level, path difficulty)
+_EXP_COMPATIBILITY = {
+    ('Entry', 'Easy'): 20,
+    ('Entry', 'Medium'): 10,
+    ('Entry', 'Hard'): -10,
+    ('Mid', 'Easy'): 15,
+    ('Mid', 'Medium'): 20,
+    ('Mid', 'Hard'): 10,
+    ('Senior', 'Easy'): 10,
+    ('Senior', 'Medium'): 15,
+    ('Senior', 'Hard'): 20
+}
+
+# Score bonus by growth potential
+_GROWTH_BONUS = {'Very High': 15, 'High': 10, 'Medium': 5, 'Low': 0}
+
+def _static_path_score(path: Dict) -> int:
+    """User-independent part of a path's recommendation score"""
+    return path.get('market_demand', 50) + _GROWTH_BONUS.get(path.get('growth_potential', 'Medium'), 5)
+
+@lru_cache(maxsize=4096)
+def _path_score(static_score: int, needed_skill_set: frozenset, difficulty: str,
+                user_skill_set: frozenset, exp_level: str) -> int:
+    """Combine a path's static score with the user-dependent skill and experience terms"""
+    skill_match_bonus = (len(user_skill_set & needed_skill_set) / len(needed_skill_set)) * 30 if needed_skill_set else 0
+    score = static_score + skill_match_bonus + _EXP_COMPATIBILITY.get((exp_level, difficulty), 10)
+    return min(int(score), 100)  # Cap at 100
+
+# Columnar view of _CAREER_PATHS for the recommendation scorer: row i of every
+# column describes the same path, and _DOMAIN_ROWS maps each domain to its rows.
+_PATH_RECORDS = tuple(path for domain in _CAREER_PATHS.values() for path in domain['paths'])
+_PATH_DOMAINS = tuple(name for name, domain in _CAREER_PATHS.items() for _ in domain['paths'])
+_PATH_STATIC_SCORES = tuple(_static_path_score(path) for path in _PATH_RECORDS)
+_PATH_NEEDED_SETS = tuple(_NEEDED_SKILL_SETS[path['title']] for path in _PATH_RECORDS)
+_PATH_DIFFICULTIES = tuple(path.get('difficulty', 'Medium') for path in _PATH_RECORDS)
+_DOMAIN_ROWS = {}
+for _row, _domain in enumerate(_PATH_DOMAINS):
+    _DOMAIN_ROWS.setdefault(_domain, []).append(_row)
+_DOMAIN_ROWS = {domain: tuple(rows) for domain, rows in _DOMAIN_ROWS.items()}
+del _row, _domain
+
+# Industry growth trends
+_INDUSTRY_TRENDS = _freeze({
+    'AI/ML': {'growth_rate': 35, 'job_increase': 42},
+    'Cloud Computing': {'growth_rate': 25, 'job_increase': 30},
+    'Cybersecurity': {'growth_rate': 28, 'job_increase': 35},
+    'Web Development': {'growth_rate': 15, 'job_increase': 20},
+    'Mobile Development': {'growth_rate': 18, 'job_increase': 22},
+    'Data Engineering': {'growth_rate': 32, 'job_increase': 38}
+})
+
+# Technical domains used to categorize user skills
+_SKILL_CATEGORIES = {
+    'Frontend': frozenset(['React', 'Vue.js', 'Angular', 'JavaScript', 'TypeScript', 'HTML', 'CSS']),
+    'Backend': frozenset(['Node.js', 'Python', 'Java', 'C#', 'Django', 'Flask', 'Express']),
+    'Database': frozenset(['SQL', 'MongoDB', 'PostgreSQL', 'MySQL', 'Redis']),
+    'Cloud': frozenset(['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes']),
+    'Data Science': frozenset(['Machine Learning', 'Data Analysis', 'Statistics', 'R', 'Pandas', 'NumPy']),
+    'DevOps': frozenset(['Jenkins', 'Git', 'CI/CD', 'Terraform', 'Ansible']),
+    'Mobile': frozenset(['React Native', 'Flutter', 'iOS', 'Android', 'Swift', 'Kotlin'])
+}
+
+# Inverted index: skill -> category
+_SKILL_TO_CATEGORY = {
+    skill: category
+    for category, category_skills in _SKILL_CATEGORIES.items()
+    for skill in category_skills
+}
+
+class CareerRecommenderAgent:
+    def __init__(self):
+        # Static tables are shared across instances; see _CAREER_PATHS / _INDUSTRY_TRENDS
+        self.career_paths = _CAREER_PATHS
+        self.industry_trends = _INDUSTRY_TRENDS
     
     def analyze_user_profile(self, user_skills: List[str], experience: str, interests: List[str] = None) -> Dict:
-        """Analyze user profile to understand current position and potential"""
+        """
+        Analyze user profile to understand current position and potential
+        Results are memoized on (skills, experience, interests); every caller gets its own copy
+        """
         try:
-            # Categorize current skills
-            skill_categories = self.categorize_skills(user_skills)
-            
-            # Determine experience level
-            exp_level = self.parse_experience_level(experience)
-            
-            # Calculate skill strengths
-            strengths = self.identify_strengths(user_skills, skill_categories)
-            
-            # Identify potential career domains
-            potential_domains = self.identify_career_domains(skill_categories, strengths)
-            
-            return {
-                'skill_categories': skill_categories,
-                'experience_level': exp_level,
-                'strengths': strengths,
-                'potential_domains': potential_domains,
-                'profile_completeness': self.calculate_profile_completeness(user_skills, experience, interests)
-            }
+            analysis = self._cached_profile_analysis(tuple(user_skills), experience, tuple(interests or ()))
+            return _thaw(analysis)
             
         except Exception as e:
             print(f"Error analyzing user profile: {str(e)}")
             return {'error': str(e)}
     
-    def categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
-        """Categorize user skills into technical domains"""
-        categories = {
-            'Frontend': ['React', 'Vue.js', 'Angular', 'JavaScript', 'TypeScript', 'HTML', 'CSS'],
-            'Backend': ['Node.js', 'Python', 'Java', 'C#', 'Django', 'Flask', 'Express'],
-            'Database': ['SQL', 'MongoDB', 'PostgreSQL', 'MySQL', 'Redis'],
-            'Cloud': ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes'],
-            'Data Science': ['Machine Learning', 'Data Analysis', 'Statistics', 'R', 'Pandas', 'NumPy'],
-            'DevOps': ['Jenkins', 'Git', 'CI/CD', 'Terraform', 'Ansible'],
-            'Mobile': ['React Native', 'Flutter', 'iOS', 'Android', 'Swift', 'Kotlin']
-        }
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _cached_profile_analysis(cls, user_skills: tuple, experience: str, interests: tuple) -> MappingProxyType:
+        """Shared, read-only profile analysis keyed on hashable inputs"""
+        return _freeze(cls()._analyze_user_profile(list(user_skills), experience, list(interests)))
+    
+    def _analyze_user_profile(self, user_skills: List[str], experience: str, interests: List[str]) -> Dict:
+        """Uncached profile analysis"""
+        # Categorize current skills
+        skill_categories = self.categorize_skills(user_skills)
+        
+        # Determine experience level
+        exp_level = self.parse_experience_level(experience)
         
-        user_categories = {}
-        for category, category_skills in categories.items():
-            user_skills_in_category = [skill for skill in skills if skill in category_skills]
-            if user_skills_in_category:
-                user_categories[category] = user_skills_in_category
+        # Calculate skill strengths
+        strengths = self.identify_strengths(user_skills, skill_categories)
         
-        return user_categories
+        # Identify potential career domains
+        potential_domains = self.identify_career_domains(skill_categories, strengths)
+        
+        return {
+            'skill_categories': skill_categories,
+            'experience_level': exp_level,
+            'strengths': strengths,
+            'potential_domains': potential_domains,
+            'profile_completeness': self.calculate_profile_completeness(user_skills, experience, interests)
+        }
+    
+    def categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
+        """Categorize user skills into technical domains"""
+        buckets = {}
+        for skill in skills:
+            category = _SKILL_TO_CATEGORY.get(skill)
+            if category:
+                buckets.setdefault(category, []).append(skill)
+        
+        # Keep the canonical category order so downstream tie-breaks are stable
+        return {category: buckets[category] for category in _SKILL_CATEGORIES if category in buckets}
     
     def parse_experience_level(self, experience: str) -> str:
         """Parse experience string to determine level"""
         if not experience or experience == "Not specified":
             return "Entry"
         
-        exp_lower = experience.lower()
-        if any(term in exp_lower for term in ['0-1', '0', '1 year', 'entry', 'junior', 'graduate']):
-            return "Entry"
-        elif any(term in exp_lower for term in ['2', '3', '4', '2-4', 'mid']):
-            return "Mid"
-        elif any(term in exp_lower for term in ['5', '6', '7', '8', '5+', 'senior']):
-            return "Senior"
-        else:
-            return "Mid"  # Default
+        # Entry terms take precedence over mid, and mid over senior, wherever they
+        # appear in the string (e.g. "10 years" contains "0" and maps to Entry)
+        match = _EXPERIENCE_LEVEL_RE.match(experience)
+        if match:
+            return _EXPERIENCE_LEVELS[match.lastgroup]
+        return "Mid"  # Default
     
     def identify_strengths(self, user_skills: List[str], skill_categories: Dict[str, List[str]]) -> List[str]:
         """Identify user's strongest technical areas"""
-        strengths = []
-        
-        # Categories with most skills indicate strengths
-        category_counts = {cat: len(skills) for cat, skills in skill_categories.items()}
-        sorted_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        # Top 2-3 categories with at least 2 skills each
-        for category, count in sorted_categories:
-            if count >= 2 and len(strengths) < 3:
-                strengths.append(category)
-        
-        return strengths
+        # Top 3 categories by skill count (ties keep category order), each with at least 2 skills
+        top_categories = heapq.nlargest(3, skill_categories.items(), key=lambda item: len(item[1]))
+        return [category for category, skills in top_categories if len(skills) >= 2]
     
     def identify_career_domains(self, skill_categories: Dict[str, List[str]], strengths: List[str]) -> List[str]:
         """Identify potential career domains based on skills"""
@@ -327,104 +456,80 @@ class CareerRecommenderAgent:
         return suggestions
     
     def get_personalized_recommendations(self, user_profile: Dict, limit: int = 5) -> List[Dict]:
-        """Generate personalized career path recommendations"""
+        """
+        Generate personalized career path recommendations
+        Results are memoized on the profile fields that affect them; every caller gets its own copy
+        """
         try:
-            potential_domains = user_profile.get('potential_domains', ['Software Development'])
-            experience_level = user_profile.get('experience_level', 'Mid')
-            strengths = user_profile.get('strengths', [])
-            
-            recommendations = []
+            potential_domains = tuple(user_profile.get('potential_domains', ['Software Development']))
+            profile = _normalize_profile(user_profile)
             
-            for domain in potential_domains:
-                if domain in self.career_paths:
-                    domain_paths = self.career_paths[domain]['paths']
-                    
-                    for path in domain_paths:
-                        # Calculate recommendation score
-                        score = self.calculate_recommendation_score(path, user_profile)
-                        
-                        recommendation = {
-                            **path,
-                            'domain': domain,
-                            'recommendation_score': score,
-                            'fit_explanation': self.generate_fit_explanation(path, user_profile),
-                            'next_steps': self.generate_next_steps(path, user_profile)
-                        }
-                        
-                        recommendations.append(recommendation)
-            
-            # Sort by recommendation score and return top recommendations
-            recommendations.sort(key=lambda x: x['recommendation_score'], reverse=True)
-            return recommendations[:limit]
+            recommendations = self._cached_recommendations(potential_domains, profile, limit)
+            return _thaw(recommendations)
             
         except Exception as e:
             print(f"Error generating recommendations: {str(e)}")
             return []
     
-    def calculate_recommendation_score(self, path: Dict, user_profile: Dict) -> int:
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _cached_recommendations(cls, potential_domains: tuple, profile: _Profile, limit: int) -> tuple:
+        """Shared, read-only recommendations keyed on hashable inputs"""
+        return _freeze(cls()._build_recommendations(potential_domains, profile, limit))
+    
+    def _build_recommendations(self, potential_domains: tuple, profile: _Profile, limit: int) -> List[Dict]:
+        """Uncached recommendation scoring and ranking"""
+        # Score every candidate path from the precomputed columns
+        scored = [
+            (_path_score(_PATH_STATIC_SCORES[row], _PATH_NEEDED_SETS[row],
+                         _PATH_DIFFICULTIES[row], profile.skill_set, profile.exp_level), domain, row)
+            for domain in potential_domains
+            for row in _DOMAIN_ROWS.get(domain, ())
+        ]
+        
+        # Pick the top recommendations (ties keep domain order), then build
+        # output records only for those
+        recommendations = []
+        for score, domain, row in heapq.nlargest(limit, scored, key=itemgetter(0)):
+            path = _PATH_RECORDS[row]
+            recommendation = dict(path)
+            recommendation['domain'] = domain
+            recommendation['recommendation_score'] = score
+            recommendation['fit_explanation'] = self.generate_fit_explanation(path, profile)
+            recommendation['next_steps'] = self.generate_next_steps(path, profile)
+            recommendations.append(recommendation)
+        
+        return recommendations
+    
+    def calculate_recommendation_score(self, path: Dict, user_profile: Union[Dict, _Profile]) -> int:
         """Calculate how well a career path matches the user profile"""
-        score = 0
-        
-        # Base score from market demand
-        score += path.get('market_demand', 50)
-        
-        # Bonus for matching current skills
-        user_skills = user_profile.get('skill_categories', {})
-        all_user_skills = []
-        for skills_list in user_skills.values():
-            all_user_skills.extend(skills_list)
-        
-        current_skills_needed = path.get('current_skills_needed', [])
-        matching_skills = len(set(all_user_skills) & set(current_skills_needed))
-        skill_match_bonus = (matching_skills / len(current_skills_needed)) * 30 if current_skills_needed else 0
-        score += skill_match_bonus
-        
-        # Experience level compatibility
-        exp_level = user_profile.get('experience_level', 'Mid')
-        difficulty = path.get('difficulty', 'Medium')
-        
-        exp_compatibility = {
-            ('Entry', 'Easy'): 20,
-            ('Entry', 'Medium'): 10,
-            ('Entry', 'Hard'): -10,
-            ('Mid', 'Easy'): 15,
-            ('Mid', 'Medium'): 20,
-            ('Mid', 'Hard'): 10,
-            ('Senior', 'Easy'): 10,
-            ('Senior', 'Medium'): 15,
-            ('Senior', 'Hard'): 20
-        }
-        
-        score += exp_compatibility.get((exp_level, difficulty), 10)
-        
-        # Growth potential bonus
-        growth_potential = path.get('growth_potential', 'Medium')
-        growth_bonus = {'Very High': 15, 'High': 10, 'Medium': 5, 'Low': 0}
-        score += growth_bonus.get(growth_potential, 5)
-        
-        return min(int(score), 100)  # Cap at 100
+        profile = _normalize_profile(user_profile)
+        return _path_score(
+            _static_path_score(path),
+            _needed_skill_set(path),
+            path.get('difficulty', 'Medium'),
+            profile.skill_set,
+            profile.exp_level
+        )
     
-    def generate_fit_explanation(self, path: Dict, user_profile: Dict) -> str:
+    def generate_fit_explanation(self, path: Dict, user_profile: Union[Dict, _Profile]) -> str:
         """Generate explanation of why this path fits the user"""
+        profile = _normalize_profile(user_profile)
         explanations = []
         
         # Check skill alignment
-        user_skills = user_profile.get('skill_categories', {})
-        all_user_skills = []
-        for skills_list in user_skills.values():
-            all_user_skills.extend(skills_list)
-        
-        current_skills_needed = path.get('current_skills_needed', [])
-        matching_skills = set(all_user_skills) & set(current_skills_needed)
+        needed_skill_set = _needed_skill_set(path)
+        matching_skills = profile.skill_set & needed_skill_set
         
         if matching_skills:
-            explanations.append(f"You already have {len(matching_skills)} out of {len(current_skills_needed)} required skills")
+            explanations.append(f"You already have {len(matching_skills)} out of {len(needed_skill_set)} required skills")
         
         # Experience level compatibility
-        exp_level = user_profile.get('experience_level', 'Mid')
-        if exp_level == 'Senior' and path.get('difficulty') == 'High':
+        exp_level = profile.exp_level
+        difficulty = path.get('difficulty')
+        if exp_level == 'Senior' and difficulty == 'High':
             explanations.append("Your senior experience level aligns well with this challenging role")
-        elif exp_level == 'Mid' and path.get('difficulty') == 'Medium':
+        elif exp_level == 'Mid' and difficulty == 'Medium':
             explanations.append("This role matches your current experience level perfectly")
         
         # Market demand
@@ -434,8 +539,9 @@ class CareerRecommenderAgent:
         
         return '. '.join(explanations) + '.' if explanations else 'This role matches your technical background.'
     
-    def generate_next_steps(self, path: Dict, user_profile: Dict) -> List[str]:
+    def generate_next_steps(self, path: Dict, user_profile: Union[Dict, _Profile]) -> List[str]:
         """Generate actionable next steps for pursuing this career path"""
+        profile = _normalize_profile(user_profile)
         steps = []
         
         # Skills to develop
@@ -449,7 +555,7 @@ class CareerRecommenderAgent:
             steps.append(f"Plan for {timeline} to fully transition")
         
         # Experience building
-        exp_level = user_profile.get('experience_level', 'Mid')
+        exp_level = profile.exp_level
         if exp_level == 'Entry':
             steps.append("Build practical experience through projects and internships")
         elif exp_level == 'Mid':
@@ -500,6 +606,6 @@ if __name__ == "__main__":
     recommendations = recommender.get_personalized_recommendations(profile_analysis)
     
     print("Profile Analysis:")
-    print(json.dumps(profile_analysis, indent=2))
+    print(_dumps(profile_analysis))
     print("\nCareer Recommendations:")
-    print(json.dumps(recommendations, indent=2))
+    print(_dumps(recommendations))
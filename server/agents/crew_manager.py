@@ -4,9 +4,20 @@ Coordinates all AI agents and manages workflow for career coaching tasks
 """
 
 import json
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import logging
+import copy
+import hashlib
+import itertools
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
+from typing import Dict, List, Any, Optional, Hashable, Callable, Iterable, Sequence, AsyncIterator
+from datetime import datetime, timedelta
 import asyncio
+import bisect
+import inspect
 
 # Import individual agents
 from .resume_analyzer import ResumeAnalyzerAgent
@@ -14,80 +25,322 @@ from .skill_matcher import SkillMatcherAgent
 from .job_scanner import JobScannerAgent
 from .career_recommender import CareerRecommenderAgent
 
+logger = logging.getLogger(__name__)
+
+# Fixed report text, shared across workflows (tuples, so callers cannot mutate them)
+_GENERAL_ADVICE = (
+    "Update your LinkedIn profile with new skills",
+    "Start building a portfolio or contributing to open source projects"
+)
+_TIMELINE_30_DAYS = (
+    'Complete profile assessment and improvements',
+    'Research target companies and roles',
+    'Begin skill development plan'
+)
+_TIMELINE_90_DAYS = (
+    'Complete first priority skill course',
+    'Update resume and LinkedIn profile',
+    'Start networking in target industry'
+)
+_TIMELINE_6_MONTHS = (
+    'Complete skill development goals',
+    'Build portfolio projects',
+    'Apply to target positions'
+)
+
+@lru_cache(maxsize=128)
+def _timeline_12_months(title: Optional[str]) -> tuple:
+    """Year-out milestones for a target role (the only title-dependent part of the timeline)"""
+    return (
+        f'Transition to {title} role',
+        'Continue advanced skill development',
+        'Establish yourself in new position'
+    )
+
+# Score bands for the report's executive summary, lowest first
+_SCORE_THRESHOLDS = (60, 80)
+_STRENGTH_LABELS = ('Needs Improvement', 'Good', 'Strong')
+_READINESS_LABELS = ('Low', 'Medium', 'High')
+
+@lru_cache(maxsize=256)
+def _bucket(score: float, labels: tuple, thresholds: tuple = _SCORE_THRESHOLDS) -> str:
+    """Label a score by the number of (ascending) thresholds it reaches"""
+    return labels[bisect.bisect_right(thresholds, score)]
+
+@dataclass
+class WorkflowState:
+    """
+    Status record for a single workflow run
+    Each run owns its record and mutates it in place, so concurrent workflows never
+    share multi-step updates on a common dict
+    """
+    status: str
+    stage: str
+    started_at: datetime
+    user_id: Optional[str] = None
+    completed_at: Optional[datetime] = None
+    error: Optional[str] = None
+    cached: Optional[bool] = None
+    
+    def complete(self):
+        """Mark the workflow as successfully finished"""
+        self.stage = 'completed'
+        self.status = 'completed'
+        self.completed_at = datetime.now()
+    
+    def fail(self, error: str):
+        """Mark the workflow as failed"""
+        self.status = 'error'
+        self.error = error
+        self.completed_at = datetime.now()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view of the fields that have been set"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if getattr(self, f.name) is not None}
+
+class WorkflowDAG:
+    """
+    Declarative stage graph for a workflow
+    Each node is called with its dependencies' results, in deps order; nodes whose
+    dependencies are all satisfied run concurrently, one topological level at a time
+    """
+    
+    def __init__(self):
+        self.nodes = {}
+    
+    def add_node(self, name: str, fn: Callable, deps: Iterable[str] = ()):
+        """Register a stage; fn may be sync or return an awaitable"""
+        if name in self.nodes:
+            raise ValueError(f"Duplicate workflow node: {name}")
+        self.nodes[name] = (fn, tuple(deps))
+        return self
+    
+    def levels(self, done: Iterable[str] = ()) -> List[List[str]]:
+        """Group the nodes not in done into topological levels (Kahn's algorithm)"""
+        done = set(done)
+        pending = [name for name in self.nodes if name not in done]
+        levels = []
+        while pending:
+            ready = [name for name in pending if all(dep in done for dep in self.nodes[name][1])]
+            if not ready:
+                raise ValueError(f"Unsatisfiable or cyclic workflow dependencies: {pending}")
+            levels.append(ready)
+            done.update(ready)
+            pending = [name for name in pending if name not in done]
+        return levels
+    
+    async def _call(self, name: str, results: Dict[str, Any]):
+        fn, deps = self.nodes[name]
+        result = fn(*(results[dep] for dep in deps))
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    
+    async def run(self, ctx: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute the graph and return every node's result by name
+        Results already present in ctx are used as-is and their nodes are skipped
+        """
+        results = dict(ctx or {})
+        for level in self.levels(results):
+            outputs = await asyncio.gather(*(self._call(name, results) for name in level))
+            results.update(zip(level, outputs))
+        return results
+
 class CrewAIManager:
     """
     Main orchestrator for all career coaching AI agents
     Manages workflow and coordinates between different agents
     """
     
+    # Maximum number of memoized workflow results kept per cache
+    RESULT_CACHE_SIZE = 128
+    
+    # Worker threads for the synchronous agent calls made from workflows
+    AGENT_POOL_SIZE = 8
+    
+    # Bound on tracked workflow records (oldest are dropped first) and how long
+    # finished records are kept before the background sweep removes them
+    MAX_TRACKED_WORKFLOWS = 10_000
+    WORKFLOW_TTL_HOURS = 24
+    
     def __init__(self):
-        # Initialize all agents
-        self.resume_analyzer = ResumeAnalyzerAgent()
-        self.skill_matcher = SkillMatcherAgent()
-        self.job_scanner = JobScannerAgent()
-        self.career_recommender = CareerRecommenderAgent()
+        # Agent methods are synchronous; run them off the event loop
+        self._pool = ThreadPoolExecutor(max_workers=self.AGENT_POOL_SIZE, thread_name_prefix='crew-agent')
+        
+        # Initialize all agents. Their constructors are independent of each other and
+        # may do I/O (e.g. the job scanner's cache connection), so build them concurrently
+        agent_futures = [self._pool.submit(agent_cls) for agent_cls in
+                         (ResumeAnalyzerAgent, SkillMatcherAgent, JobScannerAgent, CareerRecommenderAgent)]
+        (self.resume_analyzer, self.skill_matcher,
+         self.job_scanner, self.career_recommender) = [future.result() for future in agent_futures]
         
         # Workflow status tracking
-        self.current_workflows = {}
+        self.current_workflows = OrderedDict()
+        self._sweeper_task = None
+        self._workflow_seq = itertools.count()
+        
+        # LRU caches of completed workflow results (without workflow_id)
+        self._resume_cache = OrderedDict()
+        self._job_cache = OrderedDict()
         
     def create_workflow_id(self) -> str:
-        """Generate unique workflow ID"""
-        return f"workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{id(self)}"
+        """Generate unique workflow ID (per-manager sequence number plus a random suffix)"""
+        return f"workflow_{next(self._workflow_seq):08x}_{uuid.uuid4().hex[:8]}"
     
-    async def process_resume_upload(self, resume_content: str, user_id: str) -> Dict[str, Any]:
+    async def _run(self, fn: Callable, *args, **kwargs):
+        """Run a synchronous agent call on the shared pool without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(self._pool, partial(fn, *args, **kwargs))
+    
+    def _track_workflow(self, workflow_id: str, workflow: WorkflowState) -> WorkflowState:
+        """Register a workflow record, dropping the oldest once over the cap"""
+        self.current_workflows[workflow_id] = workflow
+        while len(self.current_workflows) > self.MAX_TRACKED_WORKFLOWS:
+            self.current_workflows.popitem(last=False)
+        self._ensure_sweeper()
+        return workflow
+    
+    def _ensure_sweeper(self):
+        """Start the periodic cleanup task on the running loop if it is not already running"""
+        if self._sweeper_task is not None and not self._sweeper_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop (sync caller); cleanup_completed_workflows can still be called manually
+        self._sweeper_task = loop.create_task(self._sweeper())
+    
+    async def _sweeper(self):
+        """Remove expired finished workflows every tenth of the TTL"""
+        while True:
+            await asyncio.sleep(self.WORKFLOW_TTL_HOURS * 3600 / 10)
+            self.cleanup_completed_workflows(self.WORKFLOW_TTL_HOURS)
+    
+    def _cache_get(self, cache: OrderedDict, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return a private copy of a cached result, marking it most recently used"""
+        if key is None or key not in cache:
+            return None
+        cache.move_to_end(key)
+        return copy.deepcopy(cache[key])
+    
+    def _cache_put(self, cache: OrderedDict, key: Hashable, result: Dict[str, Any]):
+        """Store a completed result, minus its workflow_id, evicting the oldest entry when full"""
+        if key is None:
+            return
+        cache[key] = copy.deepcopy({k: v for k, v in result.items() if k != 'workflow_id'})
+        cache.move_to_end(key)
+        if len(cache) > self.RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _record_cached_workflow(self, workflow_id: str, now: datetime, **details):
+        """Register a workflow that was answered from cache as already completed"""
+        self._track_workflow(workflow_id, WorkflowState(
+            status='completed',
+            stage='completed',
+            started_at=now,
+            completed_at=now,
+            cached=True,
+            **details
+        ))
+    
+    async def process_resume_upload(self, resume_content: str, user_id: str,
+                                    parsed_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Complete resume processing workflow
         1. Analyze resume content
         2. Extract and categorize skills
         3. Calculate gaps and recommendations
+        
+        Fast path: callers that already hold a validated profile may pass it as
+        parsed_profile ({'skills': [...], 'experience': '3 years', optional 'score'}).
+        Stage 1 is then skipped, resume_content is ignored and the result is not cached.
         """
+        result = None
+        async for event in self.process_resume_upload_stream(resume_content, user_id, parsed_profile):
+            result = event['data']
+        return result
+    
+    async def process_resume_upload_stream(self, resume_content: str, user_id: str,
+                                           parsed_profile: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Resume processing workflow that yields each stage's output as soon as it is ready
+        Events are {'workflow_id', 'stage', 'data'} with stage 'resume_analysis',
+        'skill_analysis', 'career_recommendations', then 'completed' (data is the full
+        process_resume_upload result) or 'error' (data is the error result)
+        """
+        started_at = datetime.now()
         workflow_id = self.create_workflow_id()
         
         try:
+            cache_key = None
+            if parsed_profile is None:
+                # Identical resumes produce identical analyses; serve repeats from cache
+                cache_key = hashlib.blake2b(resume_content.encode(), digest_size=16).hexdigest()
+                cached = self._cache_get(self._resume_cache, cache_key)
+                if cached is not None:
+                    self._record_cached_workflow(workflow_id, started_at, user_id=user_id)
+                    yield {'workflow_id': workflow_id, 'stage': 'completed', 'data': {'workflow_id': workflow_id, **cached}}
+                    return
+            
             # Update workflow status
-            self.current_workflows[workflow_id] = {
-                'status': 'processing',
-                'stage': 'resume_analysis',
-                'user_id': user_id,
-                'started_at': datetime.now()
-            }
+            workflow = self._track_workflow(workflow_id, WorkflowState(
+                status='processing',
+                stage='resume_analysis',
+                started_at=started_at,
+                user_id=user_id
+            ))
             
-            # Stage 1: Resume Analysis
-            print(f"[{workflow_id}] Starting resume analysis...")
-            resume_analysis = self.resume_analyzer.analyze_resume(resume_content)
+            if parsed_profile is not None:
+                # Stage 1 skipped: use the caller's pre-validated profile as parsed data
+                resume_analysis = {
+                    'parsed_data': parsed_profile,
+                    'score': parsed_profile.get('score', 0),
+                    'prevalidated': True
+                }
+            else:
+                # Stage 1: Resume Analysis
+                logger.info("[%s] Starting resume analysis...", workflow_id)
+                resume_analysis = await self._run(self.resume_analyzer.analyze_resume, resume_content)
+                
+                if 'error' in resume_analysis:
+                    workflow.fail(resume_analysis['error'])
+                    yield {'workflow_id': workflow_id, 'stage': 'error',
+                           'data': {'error': resume_analysis['error'], 'workflow_id': workflow_id}}
+                    return
             
-            if 'error' in resume_analysis:
-                return {'error': resume_analysis['error'], 'workflow_id': workflow_id}
+            yield {'workflow_id': workflow_id, 'stage': 'resume_analysis', 'data': resume_analysis}
             
             # Stage 2: Skill Analysis
-            self.current_workflows[workflow_id]['stage'] = 'skill_analysis'
-            print(f"[{workflow_id}] Analyzing skills...")
+            workflow.stage = 'skill_analysis'
+            logger.info("[%s] Analyzing skills...", workflow_id)
             
-            extracted_skills = resume_analysis.get('parsed_data', {}).get('skills', [])
-            experience = resume_analysis.get('parsed_data', {}).get('experience', '2 years')
+            parsed_data = resume_analysis.get('parsed_data', {})
+            extracted_skills = parsed_data.get('skills', [])
+            experience = parsed_data.get('experience', '2 years')
             
-            skill_analysis = self.skill_matcher.analyze_user_skills(extracted_skills, experience)
+            skill_analysis = await self._run(self.skill_matcher.analyze_user_skills, extracted_skills, experience)
+            yield {'workflow_id': workflow_id, 'stage': 'skill_analysis', 'data': skill_analysis}
             
             # Stage 3: Generate Initial Recommendations
-            self.current_workflows[workflow_id]['stage'] = 'generating_recommendations'
-            print(f"[{workflow_id}] Generating recommendations...")
+            workflow.stage = 'generating_recommendations'
+            logger.info("[%s] Generating recommendations...", workflow_id)
             
             # Create user profile for recommendations
+            categorized_skills = skill_analysis.get('categorized_skills', {})
             user_profile = {
                 'skills': extracted_skills,
                 'experience_level': self.skill_matcher.assess_skill_level('general', experience),
-                'skill_categories': skill_analysis.get('categorized_skills', {}),
-                'strengths': list(skill_analysis.get('categorized_skills', {}).keys())[:3]
+                'skill_categories': categorized_skills,
+                'strengths': list(itertools.islice(categorized_skills, 3))
             }
             
-            career_recommendations = self.career_recommender.get_personalized_recommendations(user_profile, limit=3)
+            career_recommendations = await self._run(self.career_recommender.get_personalized_recommendations, user_profile, limit=3)
+            yield {'workflow_id': workflow_id, 'stage': 'career_recommendations', 'data': career_recommendations}
             
             # Complete workflow
-            self.current_workflows[workflow_id]['stage'] = 'completed'
-            self.current_workflows[workflow_id]['status'] = 'completed'
-            self.current_workflows[workflow_id]['completed_at'] = datetime.now()
+            workflow.complete()
             
-            return {
+            result = {
                 'workflow_id': workflow_id,
                 'resume_analysis': resume_analysis,
                 'skill_analysis': skill_analysis,
@@ -95,13 +348,15 @@ class CrewAIManager:
                 'status': 'completed',
                 'next_steps': self.generate_next_steps(resume_analysis, skill_analysis, career_recommendations)
             }
+            self._cache_put(self._resume_cache, cache_key, result)
+            
+            yield {'workflow_id': workflow_id, 'stage': 'completed', 'data': result}
             
         except Exception as e:
-            print(f"Error in resume workflow {workflow_id}: {str(e)}")
-            self.current_workflows[workflow_id]['status'] = 'error'
-            self.current_workflows[workflow_id]['error'] = str(e)
+            logger.error("Error in resume workflow %s: %s", workflow_id, e)
+            self._fail_workflow(workflow_id, str(e))
             
-            return {'error': str(e), 'workflow_id': workflow_id}
+            yield {'workflow_id': workflow_id, 'stage': 'error', 'data': {'error': str(e), 'workflow_id': workflow_id}}
     
     async def get_job_recommendations(self, user_skills: List[str], filters: Dict = None) -> Dict[str, Any]:
         """
@@ -110,47 +365,77 @@ class CrewAIManager:
         2. Calculate match scores
         3. Provide insights and recommendations
         """
+        started_at = datetime.now()
         workflow_id = self.create_workflow_id()
         
         try:
-            self.current_workflows[workflow_id] = {
-                'status': 'processing',
-                'stage': 'job_search',
-                'started_at': datetime.now()
-            }
+            cache_key = self._job_cache_key(user_skills, filters)
+            cached = self._cache_get(self._job_cache, cache_key)
+            if cached is not None:
+                self._record_cached_workflow(workflow_id, started_at)
+                return {'workflow_id': workflow_id, **cached}
             
-            print(f"[{workflow_id}] Searching for jobs...")
+            workflow = self._track_workflow(workflow_id, WorkflowState(
+                status='processing',
+                stage='job_search',
+                started_at=started_at
+            ))
+            
+            logger.info("[%s] Searching for jobs...", workflow_id)
             
             # Get job recommendations
-            job_search_results = self.job_scanner.search_jobs(user_skills, filters)
+            job_search_results = await self._run(self.job_scanner.search_jobs, user_skills, filters)
             
             # Analyze skill gaps for top jobs
             top_jobs = job_search_results.get('jobs', [])[:5]
-            gap_analysis = []
             
-            for job in top_jobs:
-                job_requirements = job.get('requirements', [])
-                match_analysis = self.skill_matcher.calculate_skill_match_score(user_skills, job_requirements)
-                gap_analysis.append({
+            # Score all top jobs in one matcher call
+            match_analyses = await self._run(
+                self.skill_matcher.calculate_skill_match_scores_batch,
+                user_skills,
+                [job.get('requirements', []) for job in top_jobs]
+            )
+            
+            gap_analysis = [
+                {
                     'job_title': job.get('title'),
                     'company': job.get('company'),
                     'match_analysis': match_analysis
-                })
+                }
+                for job, match_analysis in zip(top_jobs, match_analyses)
+            ]
             
-            self.current_workflows[workflow_id]['status'] = 'completed'
+            workflow.complete()
             
-            return {
+            result = {
                 'workflow_id': workflow_id,
                 'job_search_results': job_search_results,
                 'gap_analysis': gap_analysis,
                 'recommendations': self.generate_job_application_strategy(gap_analysis),
                 'status': 'completed'
             }
+            self._cache_put(self._job_cache, cache_key, result)
+            
+            return result
             
         except Exception as e:
-            print(f"Error in job recommendation workflow {workflow_id}: {str(e)}")
+            logger.error("Error in job recommendation workflow %s: %s", workflow_id, e)
+            self._fail_workflow(workflow_id, str(e))
             return {'error': str(e), 'workflow_id': workflow_id}
     
+    def _job_cache_key(self, user_skills: List[str], filters: Optional[Dict]) -> Optional[Hashable]:
+        """Cache key for a job search, or None when the search must not be cached"""
+        filters = filters or {}
+        if filters.get('use_live_data', False):
+            return None  # Live listings change; always fetch fresh
+        
+        key = (tuple(sorted(user_skills or ())), frozenset(filters.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None  # Unhashable filter values
+        return key
+    
     async def comprehensive_career_analysis(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Complete career analysis workflow combining all agents
@@ -158,52 +443,56 @@ class CrewAIManager:
         2. Identify career opportunities
         3. Suggest learning paths
         4. Provide market insights
+        
+        Fast path: when user_data['pre_scored'] is True, user_data['profile_analysis']
+        must hold a prior CareerRecommenderAgent.analyze_user_profile result; it is
+        used as-is and profile analysis is skipped.
         """
+        started_at = datetime.now()
         workflow_id = self.create_workflow_id()
         
         try:
-            self.current_workflows[workflow_id] = {
-                'status': 'processing',
-                'stage': 'comprehensive_analysis',
-                'started_at': datetime.now()
-            }
+            workflow = self._track_workflow(workflow_id, WorkflowState(
+                status='processing',
+                stage='comprehensive_analysis',
+                started_at=started_at
+            ))
             
             user_skills = user_data.get('skills', [])
             experience = user_data.get('experience', '2 years')
             interests = user_data.get('interests', [])
             location_pref = user_data.get('location_preference', 'Remote')
             
-            print(f"[{workflow_id}] Starting comprehensive analysis...")
-            
-            # Stage 1: Profile Analysis
-            profile_analysis = self.career_recommender.analyze_user_profile(user_skills, experience, interests)
-            
-            # Stage 2: Skill Gap Analysis
-            skill_analysis = self.skill_matcher.analyze_user_skills(user_skills, experience)
+            logger.info("[%s] Starting comprehensive analysis...", workflow_id)
             
-            # Stage 3: Job Market Analysis
-            job_market_analysis = self.job_scanner.get_job_recommendations({
+            # Independent stages run concurrently; job market analysis and career path
+            # recommendations wait only for the profile analysis
+            dag = WorkflowDAG()
+            dag.add_node('profile', lambda: self._run(self.career_recommender.analyze_user_profile, user_skills, experience, interests))
+            dag.add_node('skills', lambda: self._run(self.skill_matcher.analyze_user_skills, user_skills, experience))
+            dag.add_node('insights', lambda: self._run(self.career_recommender.get_industry_insights))
+            dag.add_node('market', lambda profile: self._run(self.job_scanner.get_job_recommendations, {
                 'skills': user_skills,
-                'experience_level': profile_analysis.get('experience_level', 'Mid-level'),
+                'experience_level': profile.get('experience_level', 'Mid-level'),
                 'location_preference': location_pref
-            })
-            
-            # Stage 4: Career Path Recommendations
-            career_recommendations = self.career_recommender.get_personalized_recommendations(profile_analysis, limit=5)
+            }), deps=('profile',))
+            dag.add_node('recs', lambda profile: self._run(self.career_recommender.get_personalized_recommendations, profile, limit=5),
+                         deps=('profile',))
+            dag.add_node('report', self.generate_comprehensive_report,
+                         deps=('profile', 'skills', 'market', 'recs', 'insights'))
             
-            # Stage 5: Industry Insights
-            industry_insights = self.career_recommender.get_industry_insights()
+            # Pre-scored profiles seed the graph, so the profile stage is skipped
+            ctx = {'profile': user_data['profile_analysis']} if user_data.get('pre_scored') is True else None
+            results = await dag.run(ctx)
             
-            # Generate comprehensive report
-            comprehensive_report = self.generate_comprehensive_report(
-                profile_analysis,
-                skill_analysis,
-                job_market_analysis,
-                career_recommendations,
-                industry_insights
-            )
+            profile_analysis = results['profile']
+            skill_analysis = results['skills']
+            job_market_analysis = results['market']
+            career_recommendations = results['recs']
+            industry_insights = results['insights']
+            comprehensive_report = results['report']
             
-            self.current_workflows[workflow_id]['status'] = 'completed'
+            workflow.complete()
             
             return {
                 'workflow_id': workflow_id,
@@ -219,7 +508,8 @@ class CrewAIManager:
             }
             
         except Exception as e:
-            print(f"Error in comprehensive analysis workflow {workflow_id}: {str(e)}")
+            logger.error("Error in comprehensive analysis workflow %s: %s", workflow_id, e)
+            self._fail_workflow(workflow_id, str(e))
             return {'error': str(e), 'workflow_id': workflow_id}
     
     def generate_next_steps(self, resume_analysis: Dict, skill_analysis: Dict, career_recommendations: List[Dict]) -> List[str]:
@@ -232,19 +522,16 @@ class CrewAIManager:
             steps.append("Improve your resume by adding more detailed experience descriptions")
         
         # Skill development
-        skill_gaps = skill_analysis.get('skill_gaps', {})
-        critical_missing = skill_gaps.get('critical_missing', [])
+        critical_missing = skill_analysis.get('skill_gaps', {}).get('critical_missing', [])
         if critical_missing:
             steps.append(f"Prioritize learning: {', '.join(critical_missing[:2])}")
         
         # Career progression
         if career_recommendations:
-            top_recommendation = career_recommendations[0]
-            steps.append(f"Consider pursuing: {top_recommendation.get('title')}")
+            steps.append(f"Consider pursuing: {career_recommendations[0].get('title')}")
         
         # General advice
-        steps.append("Update your LinkedIn profile with new skills")
-        steps.append("Start building a portfolio or contributing to open source projects")
+        steps.extend(_GENERAL_ADVICE)
         
         return steps
     
@@ -253,29 +540,33 @@ class CrewAIManager:
         if not gap_analysis:
             return {'error': 'No gap analysis available'}
         
-        high_match_jobs = [job for job in gap_analysis if job.get('match_analysis', {}).get('match_percentage', 0) >= 80]
-        medium_match_jobs = [job for job in gap_analysis if 60 <= job.get('match_analysis', {}).get('match_percentage', 0) < 80]
+        # Single pass: bucket by match percentage and tally missing skills
+        high_match_count = 0
+        medium_match_count = 0
+        missing_counter = Counter()
+        for job in gap_analysis:
+            match_analysis = job.get('match_analysis', {})
+            match_percentage = match_analysis.get('match_percentage', 0)
+            if match_percentage >= 80:
+                high_match_count += 1
+            elif match_percentage >= 60:
+                medium_match_count += 1
+            missing_counter.update(match_analysis.get('missing_skills', []))
         
         strategy = {
-            'immediate_applications': len(high_match_jobs),
-            'skill_development_needed': len(medium_match_jobs),
+            'immediate_applications': high_match_count,
+            'skill_development_needed': medium_match_count,
             'recommendations': []
         }
         
-        if high_match_jobs:
-            strategy['recommendations'].append(f"Apply immediately to {len(high_match_jobs)} high-match positions")
+        if high_match_count:
+            strategy['recommendations'].append(f"Apply immediately to {high_match_count} high-match positions")
         
-        if medium_match_jobs:
-            strategy['recommendations'].append(f"Develop skills for {len(medium_match_jobs)} potential opportunities")
+        if medium_match_count:
+            strategy['recommendations'].append(f"Develop skills for {medium_match_count} potential opportunities")
         
-        # Extract most common missing skills
-        all_missing_skills = []
-        for job in gap_analysis:
-            missing = job.get('match_analysis', {}).get('missing_skills', [])
-            all_missing_skills.extend(missing)
-        
-        from collections import Counter
-        common_missing = Counter(all_missing_skills).most_common(3)
+        # Most common missing skills
+        common_missing = missing_counter.most_common(3)
         
         if common_missing:
             missing_skills = [skill[0] for skill in common_missing]
@@ -292,10 +583,11 @@ class CrewAIManager:
         profile_score = profile_analysis.get('profile_completeness', {}).get('score', 0)
         market_alignment = skill_analysis.get('market_alignment', {}).get('alignment_score', 0)
         job_opportunities = len(job_market_analysis.get('recommended_jobs', []))
+        critical_missing = skill_analysis.get('skill_gaps', {}).get('critical_missing')
         
         executive_summary = {
-            'profile_strength': 'Strong' if profile_score >= 80 else 'Good' if profile_score >= 60 else 'Needs Improvement',
-            'market_readiness': 'High' if market_alignment >= 80 else 'Medium' if market_alignment >= 60 else 'Low',
+            'profile_strength': _bucket(profile_score, _STRENGTH_LABELS),
+            'market_readiness': _bucket(market_alignment, _READINESS_LABELS),
             'job_opportunities': job_opportunities,
             'top_career_path': career_recommendations[0].get('title') if career_recommendations else 'General Development'
         }
@@ -308,9 +600,8 @@ class CrewAIManager:
             insights.append("Your profile could be strengthened with more detailed information")
         
         # Skill insights
-        skill_gaps = skill_analysis.get('skill_gaps', {})
-        if skill_gaps.get('critical_missing'):
-            insights.append(f"Critical skills gap identified: {len(skill_gaps['critical_missing'])} high-demand skills missing")
+        if critical_missing:
+            insights.append(f"Critical skills gap identified: {len(critical_missing)} high-demand skills missing")
         
         # Market insights
         if market_alignment >= 85:
@@ -338,16 +629,19 @@ class CrewAIManager:
     def generate_priority_actions(self, profile_analysis: Dict, skill_analysis: Dict, 
                                 career_recommendations: List[Dict]) -> List[Dict]:
         """Generate prioritized action items"""
-        actions = []
+        # Bucketing by priority keeps generation order within each priority,
+        # matching the stable sort this replaces
+        buckets = {'High': [], 'Medium': [], 'Low': []}
         
         # Profile completion actions
         profile_details = profile_analysis.get('profile_completeness', {}).get('details', {})
         for area, status in profile_details.items():
             if status in ['Missing', 'Needs improvement']:
-                actions.append({
+                priority = 'High' if area in ['skills', 'experience'] else 'Medium'
+                buckets[priority].append({
                     'category': 'Profile',
                     'action': f'Complete {area} information',
-                    'priority': 'High' if area in ['skills', 'experience'] else 'Medium',
+                    'priority': priority,
                     'effort': 'Low',
                     'timeline': '1 week'
                 })
@@ -357,7 +651,7 @@ class CrewAIManager:
         for gap_type, skills in skill_gaps.items():
             if skills and gap_type == 'critical_missing':
                 for skill in skills[:2]:  # Top 2 critical skills
-                    actions.append({
+                    buckets['High'].append({
                         'category': 'Skill Development',
                         'action': f'Learn {skill}',
                         'priority': 'High',
@@ -368,7 +662,7 @@ class CrewAIManager:
         # Career progression actions
         if career_recommendations:
             top_recommendation = career_recommendations[0]
-            actions.append({
+            buckets['Medium'].append({
                 'category': 'Career Planning',
                 'action': f'Explore {top_recommendation.get("title")} opportunities',
                 'priority': 'Medium',
@@ -376,13 +670,10 @@ class CrewAIManager:
                 'timeline': '1 month'
             })
         
-        # Sort by priority
-        priority_order = {'High': 3, 'Medium': 2, 'Low': 1}
-        actions.sort(key=lambda x: priority_order.get(x['priority'], 0), reverse=True)
-        
-        return actions[:5]  # Top 5 actions
+        # Highest priority first
+        return list(itertools.islice(itertools.chain.from_iterable(buckets.values()), 5))  # Top 5 actions
     
-    def generate_success_timeline(self, career_recommendations: List[Dict]) -> Dict[str, List[str]]:
+    def generate_success_timeline(self, career_recommendations: List[Dict]) -> Dict[str, Sequence[str]]:
         """Generate timeline for career success"""
         if not career_recommendations:
             return {}
@@ -390,45 +681,36 @@ class CrewAIManager:
         top_recommendation = career_recommendations[0]
         
         timeline = {
-            'next_30_days': [
-                'Complete profile assessment and improvements',
-                'Research target companies and roles',
-                'Begin skill development plan'
-            ],
-            'next_90_days': [
-                'Complete first priority skill course',
-                'Update resume and LinkedIn profile',
-                'Start networking in target industry'
-            ],
-            'next_6_months': [
-                'Complete skill development goals',
-                'Build portfolio projects',
-                'Apply to target positions'
-            ],
-            'next_12_months': [
-                f'Transition to {top_recommendation.get("title")} role',
-                'Continue advanced skill development',
-                'Establish yourself in new position'
-            ]
+            'next_30_days': _TIMELINE_30_DAYS,
+            'next_90_days': _TIMELINE_90_DAYS,
+            'next_6_months': _TIMELINE_6_MONTHS,
+            'next_12_months': _timeline_12_months(top_recommendation.get('title'))
         }
         
         return timeline
     
+    def _fail_workflow(self, workflow_id: str, error: str):
+        """Mark a registered workflow as failed; no-op if it never got registered"""
+        workflow = self.current_workflows.get(workflow_id)
+        if workflow is not None:
+            workflow.fail(error)
+    
     def get_workflow_status(self, workflow_id: str) -> Dict[str, Any]:
         """Get status of a running workflow"""
         if workflow_id in self.current_workflows:
-            return self.current_workflows[workflow_id]
+            return self.current_workflows[workflow_id].to_dict()
         else:
             return {'error': 'Workflow not found', 'workflow_id': workflow_id}
     
     def cleanup_completed_workflows(self, max_age_hours: int = 24):
         """Clean up old completed workflows"""
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        now = datetime.now()
+        cutoff_time = now - timedelta(hours=max_age_hours)
         
         workflows_to_remove = []
-        for workflow_id, workflow_data in self.current_workflows.items():
-            if (workflow_data.get('status') in ['completed', 'error'] and
-                workflow_data.get('completed_at', datetime.now()) < cutoff_time):
+        for workflow_id, workflow in self.current_workflows.items():
+            if (workflow.status in ['completed', 'error'] and
+                (workflow.completed_at or now) < cutoff_time):
                 workflows_to_remove.append(workflow_id)
         
         for workflow_id in workflows_to_remove:
@@ -473,4 +755,5 @@ if __name__ == "__main__":
         print("\nWorkflows completed successfully!")
     
     # Run test
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(test_crew_manager())
@@ -4,12 +4,170 @@ Fetches job opportunities from free APIs and matches them with user profiles
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from typing import Dict, List, Optional
+import asyncio
+import copy
+import hashlib
+import os
+import re
+import sys
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+from heapq import nlargest
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson
+    
+    def _loads(data):
+        """Parse JSON (str or bytes) with the orjson C decoder"""
+        return orjson.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        """Compact JSON encoding for cache values"""
+        return orjson.dumps(obj)
+    
+    def _dumps_pretty(obj) -> str:
+        """Pretty-print obj as JSON using the orjson C encoder"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _loads(data):
+        """Parse JSON (str or bytes) with the stdlib decoder"""
+        return json.loads(data)
+    
+    def _dumps(obj) -> str:
+        """Compact JSON encoding for cache values"""
+        return json.dumps(obj, separators=(',', ':'))
+    
+    def _dumps_pretty(obj) -> str:
+        """Pretty-print obj as JSON using the stdlib encoder"""
+        return json.dumps(obj, indent=2, default=str)
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    from .keyword_matcher import KeywordMatcher
+except ImportError:  # Run as a script
+    from keyword_matcher import KeywordMatcher
+
+# Skills recognised in job descriptions, in reporting order
+COMMON_SKILLS = (
+    'Python', 'JavaScript', 'Java', 'React', 'Node.js', 'Angular', 'Vue.js',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Machine Learning',
+    'TensorFlow', 'PyTorch', 'SQL', 'MongoDB', 'PostgreSQL', 'Redis',
+    'GraphQL', 'REST API', 'TypeScript', 'HTML', 'CSS', 'Git'
+)
+_REQUIREMENT_MATCHER = KeywordMatcher(COMMON_SKILLS)
+
+# Title words that mark a seniority level, matched as whole words
+_SENIOR_TITLE_RE = re.compile(r'\b(?:senior|lead|principal|architect)\b', re.I)
+_ENTRY_TITLE_RE = re.compile(r'\b(?:junior|entry|graduate|trainee)\b', re.I)
+
+# Salary figures like "$120k", "$120,000", "120k"
+_SALARY_RE = re.compile(r'(\d+)[k|,]?')
+
+@lru_cache(maxsize=4096)
+def _parse_min_salary(salary_string: str) -> int:
+    """Minimum salary in a salary string, memoized since listings repeat across searches"""
+    matches = _SALARY_RE.findall(salary_string.replace(',', ''))
+    
+    if matches:
+        try:
+            salary = int(matches[0])
+            if salary < 1000:  # Assume it's in thousands
+                salary *= 1000
+            return salary
+        except:
+            pass
+    
+    return 0
+
+def _parse_timestamp(date_string: str) -> datetime:
+    """Parse an ISO 8601 timestamp, with the ciso8601 C parser when installed"""
+    if CISO8601_AVAILABLE:
+        try:
+            return ciso8601.parse_datetime(date_string)
+        except ValueError:
+            pass  # Fall back to the stdlib for anything ciso8601 rejects
+    return datetime.fromisoformat(date_string.replace('Z', '+00:00'))
+
+def _plural(count: int, unit: str) -> str:
+    return f"{count} {unit}{'s' if count > 1 else ''} ago"
+
+# Relative-age labels by age in days: bisect_right(_AGE_BOUNDS, days) picks the label
+_AGE_BOUNDS = (0, 1, 2, 7, 30)
+_AGE_LABELS = (
+    lambda days: f"{days} days ago",  # Future dates
+    lambda days: "Today",
+    lambda days: "1 day ago",
+    lambda days: f"{days} days ago",
+    lambda days: _plural(days // 7, 'week'),
+    lambda days: _plural(days // 30, 'month')
+)
+
+# Bit position of every lowercased requirement seen so far; job requirements are
+# encoded as int bitmasks over it so matching is an AND plus a popcount
+_SKILL_BITS = {}
+
+@lru_cache(maxsize=1024)
+def _requirements_mask(requirements: tuple) -> int:
+    """Bitmask of a job's requirements (case-insensitive), registering unseen skills"""
+    mask = 0
+    for requirement in requirements:
+        mask |= 1 << _SKILL_BITS.setdefault(sys.intern(requirement.lower()), len(_SKILL_BITS))
+    return mask
+
+def _skills_mask(skills_lower) -> int:
+    """Bitmask of the already-registered skills among skills_lower; unknown skills match no job"""
+    mask = 0
+    for skill in skills_lower:
+        bit = _SKILL_BITS.get(skill)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
 
 class JobScannerAgent:
+    # Seconds a fetched Remotive result set is served from cache
+    REMOTIVE_CACHE_TTL = 300
+    
+    # Job count from which match scores are computed as one NumPy matrix product
+    VECTORIZE_MIN_JOBS = 64
+    
     def __init__(self):
         self.apis = {
             'remotive': {
@@ -26,6 +184,20 @@ class JobScannerAgent:
             }
         }
         
+        # Shared HTTP session: keep-alive connection pool plus retries on transient failures
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+            pool_connections=10,
+            pool_maxsize=10
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Response cache: Redis when REDIS_URL is configured, otherwise in-process
+        self.cache = self._connect_cache()
+        self._local_cache = {}
+        
         # Fallback job data for when APIs are unavailable
         self.fallback_jobs = [
             {
@@ -95,44 +267,189 @@ class JobScannerAgent:
             }
         ]
     
+    def _connect_cache(self):
+        """Redis client for response caching when REDIS_URL is configured, else None"""
+        url = os.environ.get('REDIS_URL')
+        if not (REDIS_AVAILABLE and url):
+            return None
+        try:
+            client = redis.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+            client.ping()
+            return client
+        except Exception as e:
+            print(f"Redis unavailable, using in-process cache: {str(e)}")
+            return None
+    
+    def _cache_get(self, key: str):
+        """Cached value for key, or None if missing or expired"""
+        if self.cache is not None:
+            try:
+                raw = self.cache.get(key)
+                return _loads(raw) if raw else None
+            except Exception as e:
+                print(f"Error reading job cache: {str(e)}")
+                return None
+        
+        entry = self._local_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._local_cache[key]
+            return None
+        return copy.deepcopy(value)
+    
+    def _cache_set(self, key: str, ttl: int, value):
+        """Store value under key for ttl seconds"""
+        if self.cache is not None:
+            try:
+                self.cache.setex(key, ttl, _dumps(value))
+            except Exception as e:
+                print(f"Error writing job cache: {str(e)}")
+            return
+        self._local_cache[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+    
+    def _cache_invalidate(self, prefix: str):
+        """Drop every cached entry whose key starts with prefix"""
+        if self.cache is not None:
+            try:
+                for key in self.cache.scan_iter(match=prefix + '*'):
+                    self.cache.delete(key)
+            except Exception as e:
+                print(f"Error invalidating job cache: {str(e)}")
+            return
+        for key in [key for key in self._local_cache if key.startswith(prefix)]:
+            del self._local_cache[key]
+    
+    def _remotive_cache_key(self, params: Dict, search_params: Dict = None) -> str:
+        """Cache key for a Remotive query; honours search_params['force_refresh']"""
+        if search_params and search_params.get('force_refresh'):
+            self._cache_invalidate('remotive:')
+        return 'remotive:' + hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    
+    def _remotive_request(self, search_params: Dict = None):
+        """URL and query parameters for a Remotive.io search"""
+        url = self.apis['remotive']['base_url']
+        params = {
+            'category': search_params.get('category', 'software-dev') if search_params else 'software-dev',
+            'limit': search_params.get('limit', 10) if search_params else 10
+        }
+        return url, params
+    
+    def _format_remotive_jobs(self, raw_jobs: Iterable[Dict]) -> List[Dict]:
+        """Convert the entries of a Remotive.io 'jobs' array into job records"""
+        jobs = []
+        now = datetime.now(timezone.utc)  # One clock read for the whole feed
+        
+        for job in raw_jobs:
+            description = job.get('description', '')
+            formatted_job = {
+                'title': job.get('title', 'Unknown Title'),
+                'company': job.get('company_name', 'Unknown Company'),
+                'location': job.get('candidate_required_location', 'Remote'),
+                'salary': job.get('salary', 'Not specified'),
+                'description': description[:500] + '...' if len(description) > 500 else description,
+                'requirements': self.extract_requirements(description),
+                'posted_at': self.format_date(job.get('publication_date', ''), now),
+                'apply_url': job.get('url', ''),
+                'job_type': job.get('job_type', 'Full-time'),
+                'experience_level': self.determine_experience_level(job.get('title', '')),
+                'remote': True
+            }
+            jobs.append(formatted_job)
+        
+        return jobs
+    
     def fetch_remotive_jobs(self, search_params: Dict = None) -> List[Dict]:
         """Fetch jobs from Remotive.io API"""
         try:
-            url = self.apis['remotive']['base_url']
-            params = {
-                'category': search_params.get('category', 'software-dev') if search_params else 'software-dev',
-                'limit': search_params.get('limit', 10) if search_params else 10
-            }
+            url, params = self._remotive_request(search_params)
+            cache_key = self._remotive_cache_key(params, search_params)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
             
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                jobs = []
-                
-                for job in data.get('jobs', []):
-                    formatted_job = {
-                        'title': job.get('title', 'Unknown Title'),
-                        'company': job.get('company_name', 'Unknown Company'),
-                        'location': job.get('candidate_required_location', 'Remote'),
-                        'salary': job.get('salary', 'Not specified'),
-                        'description': job.get('description', '')[:500] + '...' if len(job.get('description', '')) > 500 else job.get('description', ''),
-                        'requirements': self.extract_requirements(job.get('description', '')),
-                        'posted_at': self.format_date(job.get('publication_date', '')),
-                        'apply_url': job.get('url', ''),
-                        'job_type': job.get('job_type', 'Full-time'),
-                        'experience_level': self.determine_experience_level(job.get('title', '')),
-                        'remote': True
-                    }
-                    jobs.append(formatted_job)
-                
-                return jobs
+            # With ijson, jobs are parsed one at a time off the socket instead of
+            # materializing the whole (description-heavy) response first
+            with self.session.get(url, params=params, timeout=10, stream=IJSON_AVAILABLE) as response:
+                if response.status_code == 200:
+                    if IJSON_AVAILABLE:
+                        response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+                        jobs = self._format_remotive_jobs(ijson.items(response.raw, 'jobs.item', use_float=True))
+                    else:
+                        jobs = self._format_remotive_jobs(_loads(response.content).get('jobs', []))
+                    self._cache_set(cache_key, self.REMOTIVE_CACHE_TTL, jobs)
+                    return jobs
                 
         except Exception as e:
             print(f"Error fetching from Remotive API: {str(e)}")
             
         return []
     
+    async def _fetch_json(self, session, url: str, params: Dict) -> Optional[Dict]:
+        """GET a JSON document with aiohttp; None on a non-200 response"""
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 200:
+                return await response.json(loads=_loads, content_type=None)
+        return None
+    
+    async def fetch_remotive_jobs_async(self, session, search_params: Dict = None) -> List[Dict]:
+        """Fetch jobs from Remotive.io API on an aiohttp session"""
+        try:
+            url, params = self._remotive_request(search_params)
+            cache_key = self._remotive_cache_key(params, search_params)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            data = await self._fetch_json(session, url, params)
+            if data is not None:
+                jobs = self._format_remotive_jobs(data.get('jobs', []))
+                self._cache_set(cache_key, self.REMOTIVE_CACHE_TTL, jobs)
+                return jobs
+        except Exception as e:
+            print(f"Error fetching from Remotive API: {str(e)}")
+        
+        return []
+    
+    def _live_sources(self):
+        """(sync, async) fetcher pairs for every live job source"""
+        return [
+            (self.fetch_remotive_jobs, self.fetch_remotive_jobs_async)
+        ]
+    
+    async def fetch_all(self, filters: Dict = None) -> List[Dict]:
+        """Query every live source concurrently and merge the results in source order"""
+        sources = self._live_sources()
+        if AIOHTTP_AVAILABLE:
+            async with aiohttp.ClientSession() as session:
+                results = await asyncio.gather(*(fetch_async(session, filters) for _, fetch_async in sources),
+                                               return_exceptions=True)
+        else:
+            results = await asyncio.gather(*(asyncio.to_thread(fetch, filters) for fetch, _ in sources),
+                                           return_exceptions=True)
+        
+        jobs = []
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error fetching live jobs: {str(result)}")
+            else:
+                jobs.extend(result)
+        return jobs
+    
+    def fetch_live_jobs(self, filters: Dict = None) -> List[Dict]:
+        """Synchronous entry point for fetch_all"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_all(filters))
+        
+        # Called from inside an event loop: cannot nest asyncio.run, fetch sequentially
+        jobs = []
+        for fetch, _ in self._live_sources():
+            jobs.extend(fetch(filters))
+        return jobs
+    
     def fetch_github_jobs(self, search_params: Dict = None) -> List[Dict]:
         """Fetch jobs from GitHub Jobs API (deprecated but kept for reference)"""
         # GitHub Jobs API was discontinued, but keeping structure for other APIs
@@ -140,52 +457,26 @@ class JobScannerAgent:
     
     def extract_requirements(self, description: str) -> List[str]:
         """Extract skill requirements from job description"""
-        common_skills = [
-            'Python', 'JavaScript', 'Java', 'React', 'Node.js', 'Angular', 'Vue.js',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Machine Learning',
-            'TensorFlow', 'PyTorch', 'SQL', 'MongoDB', 'PostgreSQL', 'Redis',
-            'GraphQL', 'REST API', 'TypeScript', 'HTML', 'CSS', 'Git'
-        ]
-        
-        requirements = []
-        description_lower = description.lower()
-        
-        for skill in common_skills:
-            if skill.lower() in description_lower:
-                requirements.append(skill)
-        
+        requirements = _REQUIREMENT_MATCHER.find_in(description.lower())
         return requirements[:6]  # Limit to top 6 requirements
     
     def determine_experience_level(self, title: str) -> str:
         """Determine experience level from job title"""
-        title_lower = title.lower()
-        
-        if any(word in title_lower for word in ['senior', 'lead', 'principal', 'architect']):
+        if _SENIOR_TITLE_RE.search(title):
             return 'Senior'
-        elif any(word in title_lower for word in ['junior', 'entry', 'graduate', 'trainee']):
+        elif _ENTRY_TITLE_RE.search(title):
             return 'Entry-level'
         else:
             return 'Mid-level'
     
-    def format_date(self, date_string: str) -> str:
-        """Format date string to relative time"""
+    def format_date(self, date_string: str, now: Optional[datetime] = None) -> str:
+        """Format date string to relative time; bulk callers pass a shared timezone-aware now"""
         try:
-            job_date = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-            now = datetime.now(job_date.tzinfo)
-            diff = now - job_date
-            
-            if diff.days == 0:
-                return "Today"
-            elif diff.days == 1:
-                return "1 day ago"
-            elif diff.days < 7:
-                return f"{diff.days} days ago"
-            elif diff.days < 30:
-                weeks = diff.days // 7
-                return f"{weeks} week{'s' if weeks > 1 else ''} ago"
-            else:
-                months = diff.days // 30
-                return f"{months} month{'s' if months > 1 else ''} ago"
+            job_date = _parse_timestamp(date_string)
+            if job_date.tzinfo is None:
+                job_date = job_date.astimezone()  # Naive timestamps are local time
+            days = ((now or datetime.now(timezone.utc)) - job_date).days
+            return _AGE_LABELS[bisect_right(_AGE_BOUNDS, days)](days)
                 
         except:
             return "Recently posted"
@@ -195,28 +486,52 @@ class JobScannerAgent:
         if not job_requirements:
             return 50  # Default score if no requirements specified
         
-        user_skills_lower = [skill.lower() for skill in user_skills]
-        job_requirements_lower = [req.lower() for req in job_requirements]
-        
-        matching_skills = set(user_skills_lower) & set(job_requirements_lower)
-        match_percentage = (len(matching_skills) / len(job_requirements_lower)) * 100
+        job_mask = _requirements_mask(tuple(job_requirements))
+        user_skills_lower = {skill.lower() for skill in user_skills}
+        return self._mask_match_score(len(user_skills_lower), _skills_mask(user_skills_lower),
+                                      job_mask, len(job_requirements))
+    
+    def _mask_match_score(self, user_skill_count: int, user_mask: int, job_mask: int, requirement_count: int) -> int:
+        """calculate_job_match_score on pre-encoded skill bitmasks"""
+        matching = (user_mask & job_mask).bit_count()
+        match_percentage = (matching / requirement_count) * 100
         
         # Boost score if user has additional relevant skills
-        bonus_skills = set(user_skills_lower) - set(job_requirements_lower)
-        bonus = min(len(bonus_skills) * 5, 20)  # Max 20% bonus
+        bonus = min((user_skill_count - matching) * 5, 20)  # Max 20% bonus
         
         final_score = min(int(match_percentage + bonus), 100)
         return final_score
     
-    def search_jobs(self, user_skills: List[str] = None, filters: Dict = None) -> Dict:
-        """Main job search function"""
+    def _vector_match_scores(self, user_skill_count: int, user_mask: int, job_masks: List[int],
+                             requirement_counts: List[int]) -> List[int]:
+        """_mask_match_score for many jobs at once: unpack the masks into a 0/1 matrix and take J @ u"""
+        width = max(1, (len(_SKILL_BITS) + 7) // 8)
+        rows = np.frombuffer(b''.join(mask.to_bytes(width, 'little') for mask in job_masks), dtype=np.uint8)
+        job_matrix = np.unpackbits(rows.reshape(len(job_masks), width), axis=1, bitorder='little')
+        user_vector = np.unpackbits(np.frombuffer(user_mask.to_bytes(width, 'little'), dtype=np.uint8),
+                                    bitorder='little').astype(np.int32)
+        
+        matching = job_matrix @ user_vector
+        counts = np.asarray(requirement_counts, dtype=np.float64)
+        has_requirements = counts > 0
+        match_percentage = np.divide(matching, counts, out=np.zeros_like(counts), where=has_requirements) * 100
+        bonus = np.minimum((user_skill_count - matching) * 5, 20)  # Max 20% bonus
+        
+        scores = np.minimum((match_percentage + bonus).astype(np.int64), 100)
+        scores[~has_requirements] = 50  # Default score if no requirements specified
+        return scores.tolist()
+    
+    def search_jobs(self, user_skills: List[str] = None, filters: Dict = None, top_k: Optional[int] = None) -> Dict:
+        """
+        Main job search function
+        With top_k, only the top_k best matches are returned ('total' still counts every match)
+        """
         try:
             all_jobs = []
             
             # Try to fetch from APIs
             if filters and filters.get('use_live_data', False):
-                remotive_jobs = self.fetch_remotive_jobs(filters)
-                all_jobs.extend(remotive_jobs)
+                all_jobs.extend(self.fetch_live_jobs(filters))
             
             # Always include fallback jobs for demonstration
             all_jobs.extend(self.fallback_jobs)
@@ -227,18 +542,36 @@ class JobScannerAgent:
             
             # Calculate match scores if user skills provided
             if user_skills:
-                for job in all_jobs:
-                    job['match_score'] = self.calculate_job_match_score(
-                        user_skills, 
-                        job.get('requirements', [])
-                    )
+                # Encode every job first so the user mask covers all requirement bits
+                requirements = [job.get('requirements', []) for job in all_jobs]
+                job_masks = [_requirements_mask(tuple(reqs)) for reqs in requirements]
+                user_skills_lower = {skill.lower() for skill in user_skills}
+                user_mask = _skills_mask(user_skills_lower)
+                
+                if NUMPY_AVAILABLE and len(all_jobs) >= self.VECTORIZE_MIN_JOBS:
+                    scores = self._vector_match_scores(len(user_skills_lower), user_mask, job_masks,
+                                                       [len(reqs) for reqs in requirements])
+                    for job, score in zip(all_jobs, scores):
+                        job['match_score'] = score
+                else:
+                    for job, reqs, job_mask in zip(all_jobs, requirements, job_masks):
+                        job['match_score'] = self._mask_match_score(
+                            len(user_skills_lower), user_mask, job_mask, len(reqs)
+                        ) if reqs else 50  # Default score if no requirements specified
                 
-                # Sort by match score
-                all_jobs.sort(key=lambda x: x.get('match_score', 0), reverse=True)
+            total = len(all_jobs)
+            if user_skills:
+                # Rank by match score (stable, so equal scores keep listing order)
+                if top_k is None:
+                    all_jobs.sort(key=itemgetter('match_score'), reverse=True)
+                else:
+                    all_jobs = nlargest(top_k, all_jobs, key=itemgetter('match_score'))
+            elif top_k is not None:
+                all_jobs = all_jobs[:top_k]
             
             return {
                 'jobs': all_jobs,
-                'total': len(all_jobs),
+                'total': total,
                 'filters_applied': filters or {},
                 'last_updated': datetime.now().isoformat()
             }
@@ -254,53 +587,33 @@ class JobScannerAgent:
     
     def apply_filters(self, jobs: List[Dict], filters: Dict) -> List[Dict]:
         """Apply search filters to job list"""
-        filtered_jobs = jobs.copy()
-        
-        # Location filter
+        # Resolve each filter once; None means the filter is off
+        location_filter = None
+        match_remote = False
         if filters.get('location') and filters['location'] != 'All Locations':
             location_filter = filters['location'].lower()
-            filtered_jobs = [
-                job for job in filtered_jobs 
-                if location_filter in job['location'].lower() or 
-                (location_filter == 'remote' and job.get('remote', False))
-            ]
+            match_remote = location_filter == 'remote'
         
-        # Experience level filter
+        exp_filter = None
         if filters.get('experience') and filters['experience'] != 'All Experience':
-            exp_filter = filters['experience']
-            filtered_jobs = [
-                job for job in filtered_jobs 
-                if job.get('experience_level', '').lower() == exp_filter.lower().replace(' level', '')
-            ]
+            exp_filter = filters['experience'].lower().replace(' level', '')
         
         # Salary filter (if implemented)
-        if filters.get('min_salary'):
-            min_salary = filters['min_salary']
-            filtered_jobs = [
-                job for job in filtered_jobs 
-                if self.extract_min_salary(job.get('salary', '')) >= min_salary
-            ]
+        min_salary = filters.get('min_salary') or None
         
-        return filtered_jobs
+        # One pass with the location, experience level and salary checks in that order
+        return [
+            job for job in jobs
+            if (location_filter is None or
+                location_filter in job['location'].lower() or
+                (match_remote and job.get('remote', False)))
+            and (exp_filter is None or job.get('experience_level', '').lower() == exp_filter)
+            and (min_salary is None or _parse_min_salary(job.get('salary', '')) >= min_salary)
+        ]
     
     def extract_min_salary(self, salary_string: str) -> int:
         """Extract minimum salary from salary string"""
-        import re
-        
-        # Look for patterns like "$120k", "$120,000", "120k"
-        salary_pattern = r'(\d+)[k|,]?'
-        matches = re.findall(salary_pattern, salary_string.replace(',', ''))
-        
-        if matches:
-            try:
-                salary = int(matches[0])
-                if salary < 1000:  # Assume it's in thousands
-                    salary *= 1000
-                return salary
-            except:
-                pass
-        
-        return 0
+        return _parse_min_salary(salary_string)
     
     def get_job_recommendations(self, user_profile: Dict) -> Dict:
         """Get personalized job recommendations based on user profile"""
@@ -332,19 +645,19 @@ class JobScannerAgent:
             return {}
         
         total_jobs = len(jobs)
-        high_match_jobs = len([job for job in jobs if job.get('match_score', 0) >= 80])
-        medium_match_jobs = len([job for job in jobs if 50 <= job.get('match_score', 0) < 80])
-        
-        # Most common requirements
-        all_requirements = []
+        high_match_jobs = 0
+        medium_match_jobs = 0
         for job in jobs:
-            all_requirements.extend(job.get('requirements', []))
-        
-        requirement_counts = {}
-        for req in all_requirements:
-            requirement_counts[req] = requirement_counts.get(req, 0) + 1
+            match_score = job.get('match_score', 0)
+            if match_score >= 80:
+                high_match_jobs += 1
+            elif match_score >= 50:
+                medium_match_jobs += 1
         
-        top_requirements = sorted(requirement_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        # Most common requirements (ties keep first-seen order)
+        requirement_counts = Counter(chain.from_iterable(job.get('requirements', ()) for job in jobs))
+        top_requirements = [req for req, _ in requirement_counts.most_common(5)]
+        top_requirement_set = set(top_requirements)
         
         return {
             'total_jobs_analyzed': total_jobs,
@@ -355,8 +668,8 @@ class JobScannerAgent:
                 'medium': medium_match_jobs,
                 'low': total_jobs - high_match_jobs - medium_match_jobs
             },
-            'top_skill_requirements': [req[0] for req in top_requirements],
-            'skills_you_have': len([skill for skill in user_skills if skill in [req[0] for req in top_requirements]])
+            'top_skill_requirements': top_requirements,
+            'skills_you_have': sum(1 for skill in user_skills if skill in top_requirement_set)
         }
     
     def get_market_trends(self) -> Dict:
@@ -383,4 +696,4 @@ if __name__ == "__main__":
     }
     
     recommendations = scanner.get_job_recommendations(user_profile)
-    print(json.dumps(recommendations, indent=2))
+    print(_dumps_pretty(recommendations))
@@ -0,0 +1,47 @@
+"""
+Keyword Matcher
+Finds which entries of a fixed keyword vocabulary occur in a piece of text
+"""
+
+import sys
+from typing import Iterable, List
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matcher over a fixed vocabulary
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, otherwise one
+    substring test per keyword. Matches are returned in vocabulary order, as the
+    interned keyword objects themselves, so callers share one copy of each string.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(sys.intern(keyword) for keyword in keywords)
+        self._needles = tuple(sys.intern(keyword.lower()) for keyword in self.keywords)
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and any(self._needles):
+            # Each needle maps to every vocabulary position it occupies, so repeated
+            # keywords are reported as often as they appear, like the fallback
+            positions = {}
+            for index, needle in enumerate(self._needles):
+                positions.setdefault(needle, []).append(index)
+            self._always = tuple(positions.pop('', ()))  # '' occurs in any text
+            self._automaton = ahocorasick.Automaton()
+            for needle, indexes in positions.items():
+                self._automaton.add_word(needle, tuple(indexes))
+            self._automaton.make_automaton()
+
+    def find_in(self, text_lower: str) -> List[str]:
+        """Keywords occurring in already-lowercased text, in vocabulary order"""
+        if self._automaton is not None:
+            hits = set(self._always)
+            for _, indexes in self._automaton.iter(text_lower):
+                hits.update(indexes)
+            return [self.keywords[index] for index in sorted(hits)]
+        return [keyword for keyword, needle in zip(self.keywords, self._needles) if needle in text_lower]
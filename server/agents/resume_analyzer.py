@@ -3,19 +3,168 @@ Resume Analyzer Agent
 Parses and analyzes uploaded resumes using spaCy and pyresparser
 """
 
-import spacy
+import copy
+import hashlib
 import json
-from typing import Dict, List, Any
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 import re
+import sys
+
+try:
+    import orjson
+    
+    def _loads(data):
+        """Parse JSON (str or bytes) with the orjson C decoder"""
+        return orjson.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        """Compact JSON encoding for cache values"""
+        return orjson.dumps(obj)
+    
+    def _dumps_pretty(obj) -> str:
+        """Pretty-print obj as JSON using the orjson C encoder"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _loads(data):
+        """Parse JSON (str or bytes) with the stdlib decoder"""
+        return json.loads(data)
+    
+    def _dumps(obj) -> str:
+        """Compact JSON encoding for cache values"""
+        return json.dumps(obj, separators=(',', ':'))
+    
+    def _dumps_pretty(obj) -> str:
+        """Pretty-print obj as JSON using the stdlib encoder"""
+        return json.dumps(obj, indent=2, default=str)
+
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    from .keyword_matcher import KeywordMatcher
+except ImportError:  # Run as a script
+    from keyword_matcher import KeywordMatcher
+
+# Common technical skills database
+TECHNICAL_SKILLS = (
+    'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+    'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
+    'html', 'css', 'sass', 'typescript', 'jquery',
+    'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins',
+    'git', 'github', 'gitlab', 'jira', 'agile', 'scrum',
+    'machine learning', 'ai', 'tensorflow', 'pytorch', 'scikit-learn',
+    'data science', 'pandas', 'numpy', 'matplotlib', 'sql'
+)
+_SKILL_MATCHER = KeywordMatcher(TECHNICAL_SKILLS)
+_SKILL_DISPLAY = {skill: sys.intern(skill.title()) for skill in _SKILL_MATCHER.keywords}
+
+EDUCATION_KEYWORDS = (
+    'bachelor', 'master', 'phd', 'doctorate', 'associate',
+    'computer science', 'software engineering', 'information technology',
+    'electrical engineering', 'mathematics', 'data science'
+)
+# Whole words only, so 'master' does not match inside 'mastermind'; applied to lowercased text
+_EDUCATION_DISPLAY = {keyword: sys.intern(keyword.title()) for keyword in EDUCATION_KEYWORDS}
+_EDUCATION_RE = re.compile(r'\b(' + '|'.join(re.escape(keyword) for keyword in EDUCATION_KEYWORDS) + r')\b')
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+# Patterns like "5 years", "5+ years", "5-7 years", tried in order
+_EXPERIENCE_RES = tuple(re.compile(pattern) for pattern in (
+    r'(\d+)\s*\+?\s*years?\s*of\s*experience',
+    r'(\d+)\s*years?\s*experience',
+    r'experience\s*:?\s*(\d+)\s*years?',
+    r'(\d+)-(\d+)\s*years?\s*experience'
+))
+
+def _compile_prefilter(patterns):
+    """Compile patterns into one Hyperscan database that reports which of them occur"""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.pattern.encode() for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns)
+        )
+        return database
+    except Exception as e:
+        print(f"Warning: Hyperscan prefilter unavailable: {e}")
+        return None
+
+# Hyperscan finds which experience patterns occur in one pass; re then only extracts
+# the groups of the first one, since Hyperscan does not capture
+_EXPERIENCE_DB = _compile_prefilter(_EXPERIENCE_RES)
+_scratch = threading.local()  # Hyperscan scratch space may not be shared between threads
+
+def _matching_patterns(database, text: str):
+    """Indexes of the database patterns occurring in text, or None if it cannot be scanned"""
+    try:
+        scratch = getattr(_scratch, 'space', None)
+        if scratch is None:
+            scratch = _scratch.space = hyperscan.Scratch(database)
+        hits = set()
+        database.scan(text.encode(), match_event_handler=lambda index, *_: hits.add(index), scratch=scratch)
+        return hits
+    except Exception:  # e.g. lone surrogates that are not valid UTF-8
+        return None
+
+# Pipeline components the analyzer does not use; skipping them saves load time and memory
+_SPACY_DISABLED = ['parser', 'tagger', 'ner', 'lemmatizer', 'attribute_ruler']
+
+@lru_cache(maxsize=None)
+def _load_nlp():
+    """Load the English spaCy model once per process, on first use"""
+    if not SPACY_AVAILABLE:
+        print("Warning: spaCy not installed. Install with: pip install spacy")
+        return None
+    try:
+        return spacy.load("en_core_web_sm", disable=_SPACY_DISABLED)
+    except Exception:
+        print("Warning: spaCy English model not found. Install with: python -m spacy download en_core_web_sm")
+        return None
 
 class ResumeAnalyzerAgent:
+    # Analysis results are memoized by content hash, since parsing is deterministic
+    ANALYSIS_CACHE_SIZE = 256
+    ANALYSIS_CACHE_TTL = 3600  # seconds, for the shared Redis cache
+    BATCH_CHUNKSIZE = 8  # resumes sent to a worker process at a time
+    
     def __init__(self):
-        # Load English language model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            print("Warning: spaCy English model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        # Shared cache in Redis when REDIS_URL is configured, in front of a per-process LRU
+        self.cache = self._connect_cache()
+        self._analysis_cache = OrderedDict()
+        self._analysis_lock = threading.Lock()  # analyze_resume runs on worker threads
+        self._process_pool = None  # Started on the first batch
+    
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline (None if unavailable); loaded lazily since extraction is regex-based"""
+        return _load_nlp()
     
     def extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information from resume text"""
@@ -26,14 +175,12 @@ class ResumeAnalyzerAgent:
         }
         
         # Email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
+        emails = _EMAIL_RE.findall(text)
         if emails:
             contact_info['email'] = emails[0]
         
         # Phone extraction
-        phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, text)
+        phones = _PHONE_RE.findall(text)
         if phones:
             contact_info['phone'] = ''.join(phones[0])
         
@@ -49,67 +196,47 @@ class ResumeAnalyzerAgent:
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text"""
-        # Common technical skills database
-        technical_skills = [
-            'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-            'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-            'html', 'css', 'sass', 'typescript', 'jquery',
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins',
-            'git', 'github', 'gitlab', 'jira', 'agile', 'scrum',
-            'machine learning', 'ai', 'tensorflow', 'pytorch', 'scikit-learn',
-            'data science', 'pandas', 'numpy', 'matplotlib', 'sql'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in technical_skills:
-            if skill in text_lower:
-                found_skills.append(skill.title())
-        
-        return list(set(found_skills))  # Remove duplicates
+        return self._skills_in(text.lower())
     
     def extract_experience(self, text: str) -> str:
         """Extract years of experience"""
-        # Look for patterns like "5 years", "5+ years", "5-7 years"
-        experience_patterns = [
-            r'(\d+)\s*\+?\s*years?\s*of\s*experience',
-            r'(\d+)\s*years?\s*experience',
-            r'experience\s*:?\s*(\d+)\s*years?',
-            r'(\d+)-(\d+)\s*years?\s*experience'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text_lower)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    return f"{matches[0][0]}-{matches[0][1]} years"
-                else:
-                    return f"{matches[0]} years"
-        
-        return "Not specified"
+        return self._experience_in(text.lower())
     
     def extract_education(self, text: str) -> str:
         """Extract education information"""
-        education_keywords = [
-            'bachelor', 'master', 'phd', 'doctorate', 'associate',
-            'computer science', 'software engineering', 'information technology',
-            'electrical engineering', 'mathematics', 'data science'
-        ]
+        return self._education_in(text.lower())
+    
+    # The _*_in helpers take already-lowercased text so analyze_resume lowercases once
+    
+    def _skills_in(self, text_lower: str) -> List[str]:
+        found_skills = [_SKILL_DISPLAY[skill] for skill in _SKILL_MATCHER.find_in(text_lower)]
         
-        text_lower = text.lower()
-        education_info = []
+        return list(set(found_skills))  # Remove duplicates
+    
+    def _experience_in(self, text_lower: str) -> str:
+        patterns = _EXPERIENCE_RES
+        if _EXPERIENCE_DB is not None:
+            hits = _matching_patterns(_EXPERIENCE_DB, text_lower)
+            if hits is not None:
+                patterns = [_EXPERIENCE_RES[index] for index in sorted(hits)]
         
-        for keyword in education_keywords:
-            if keyword in text_lower:
-                education_info.append(keyword.title())
+        for pattern in patterns:
+            match = pattern.search(text_lower)  # Only the first match is used
+            if match:
+                groups = match.groups()
+                if len(groups) > 1:
+                    return f"{groups[0]}-{groups[1]} years"
+                else:
+                    return f"{groups[0]} years"
         
-        if education_info:
-            return ', '.join(set(education_info))
         return "Not specified"
     
+    def _education_in(self, text_lower: str) -> str:
+        found = set(_EDUCATION_RE.findall(text_lower))
+        education_info = [_EDUCATION_DISPLAY[keyword] for keyword in EDUCATION_KEYWORDS if keyword in found]
+        
+        return ', '.join(set(education_info)) or "Not specified"
+    
     def calculate_resume_score(self, parsed_data: Dict[str, Any]) -> int:
         """Calculate resume completeness score"""
         score = 0
@@ -143,14 +270,109 @@ class ResumeAnalyzerAgent:
         
         return min(score, 100)  # Cap at 100
     
+    def _connect_cache(self):
+        """Redis client for sharing analysis results when REDIS_URL is configured, else None"""
+        url = os.environ.get('REDIS_URL')
+        if not (REDIS_AVAILABLE and url):
+            return None
+        try:
+            client = redis.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+            client.ping()
+            return client
+        except Exception as e:
+            print(f"Redis unavailable, using in-process cache: {str(e)}")
+            return None
+    
+    def _cached_analysis(self, key: str) -> Optional[Dict[str, Any]]:
+        """Private copy of the cached analysis for key, or None"""
+        with self._analysis_lock:
+            if key in self._analysis_cache:
+                self._analysis_cache.move_to_end(key)
+                return copy.deepcopy(self._analysis_cache[key])
+        
+        if self.cache is not None:
+            try:
+                raw = self.cache.get(f"resume:{key}")
+            except Exception as e:
+                print(f"Error reading resume cache: {str(e)}")
+                return None
+            if raw:
+                result = _loads(raw)
+                self._store_analysis(key, result, shared=False)
+                return result
+        return None
+    
+    def _store_analysis(self, key: str, result: Dict[str, Any], shared: bool = True):
+        """Remember an analysis, evicting the least recently used entry when full"""
+        with self._analysis_lock:
+            self._analysis_cache[key] = copy.deepcopy(result)
+            self._analysis_cache.move_to_end(key)
+            if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        
+        if shared and self.cache is not None:
+            try:
+                self.cache.setex(f"resume:{key}", self.ANALYSIS_CACHE_TTL, _dumps(result))
+            except Exception as e:
+                print(f"Error writing resume cache: {str(e)}")
+    
     def analyze_resume(self, resume_text: str) -> Dict[str, Any]:
         """Main analysis function"""
+        if not isinstance(resume_text, str):
+            return self._analyze(resume_text)  # Reports the error
+        
+        key = hashlib.sha1(resume_text.encode('utf-8', 'surrogatepass')).hexdigest()
+        cached = self._cached_analysis(key)
+        if cached is not None:
+            return cached
+        
+        result = self._analyze(resume_text)
+        if 'error' not in result:
+            self._store_analysis(key, result)
+        return result
+    
+    def analyze_resume_batch(self, resume_texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze many resumes, spreading uncached ones across worker processes"""
+        results = [None] * len(resume_texts)
+        pending = {}  # content hash -> indexes of the resumes that share it
+        for index, resume_text in enumerate(resume_texts):
+            if not isinstance(resume_text, str):
+                results[index] = self._analyze(resume_text)
+                continue
+            key = hashlib.sha1(resume_text.encode('utf-8', 'surrogatepass')).hexdigest()
+            if key not in pending:
+                results[index] = self._cached_analysis(key)
+                if results[index] is not None:
+                    continue
+            pending.setdefault(key, []).append(index)
+        
+        if not pending:
+            return results
+        
+        keys = list(pending)
+        texts = [resume_texts[pending[key][0]] for key in keys]
+        if len(texts) == 1:
+            analyses = [self._analyze(texts[0])]
+        else:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+            analyses = self._process_pool.map(_analyze_worker, texts, chunksize=self.BATCH_CHUNKSIZE)
+        
+        for key, result in zip(keys, analyses):
+            if 'error' not in result:
+                self._store_analysis(key, result)
+            for index in pending[key]:
+                results[index] = copy.deepcopy(result)
+        return results
+    
+    def _analyze(self, resume_text: str) -> Dict[str, Any]:
         try:
             # Extract information
             contact_info = self.extract_contact_info(resume_text)
-            skills = self.extract_skills(resume_text)
-            experience = self.extract_experience(resume_text)
-            education = self.extract_education(resume_text)
+            text_lower = resume_text.lower()
+            skills = self._skills_in(text_lower)
+            experience = self._experience_in(text_lower)
+            education = self._education_in(text_lower)
             
             # Combine all extracted data
             parsed_data = {
@@ -185,6 +407,15 @@ class ResumeAnalyzerAgent:
                 'error': str(e)
             }
 
+_worker_analyzer = None
+
+def _analyze_worker(resume_text: str) -> Dict[str, Any]:
+    """analyze_resume_batch worker; each process builds its own analyzer on first use"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = ResumeAnalyzerAgent()
+    return _worker_analyzer._analyze(resume_text)
+
 # Example usage
 if __name__ == "__main__":
     analyzer = ResumeAnalyzerAgent()
@@ -212,4 +443,4 @@ if __name__ == "__main__":
     """
     
     result = analyzer.analyze_resume(sample_resume)
-    print(json.dumps(result, indent=2))
+    print(_dumps_pretty(result))
@@ -4,9 +4,22 @@ Compares user skills with market demands and identifies gaps
 """
 
 import json
-from typing import Dict, List, Set
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
 import requests
 
+# Experience strings like "3 years" or "1 year"; the leading count sets the level
+_YEARS_RE = re.compile(r'\s*(\d+)\s*years?', re.I)
+_LEVEL_BOUNDS = (1, 3, 5)  # bisect_right(_LEVEL_BOUNDS, years) indexes _LEVELS
+_LEVELS = ('beginner', 'intermediate', 'advanced', 'expert')
+
+@lru_cache(maxsize=2048)
+def _lower_frozenset(items: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercased set of items, memoized since the same requirement lists recur across users"""
+    return frozenset(item.lower() for item in items)
+
 class SkillMatcherAgent:
     def __init__(self):
         self.skill_categories = {
@@ -23,6 +36,14 @@ class SkillMatcherAgent:
         
         # Load in-demand skills from local database
         self.in_demand_skills = self.load_market_skills()
+        
+        # Case-folded lookup tables, built once instead of rescanning the lists per call
+        self._skill_to_category = {
+            skill.lower(): category
+            for category, category_skills in self.skill_categories.items()
+            for skill in category_skills
+        }
+        self._gap_buckets = self._bucket_market_skills()
     
     def load_market_skills(self) -> Dict[str, Dict]:
         """Load in-demand skills from local database"""
@@ -44,69 +65,53 @@ class SkillMatcherAgent:
         }
     
     def categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
-        """Categorize skills by type"""
-        categorized = {}
-        
-        for category, category_skills in self.skill_categories.items():
-            categorized[category] = []
-            for skill in skills:
-                if skill in category_skills:
-                    categorized[category].append(skill)
+        """Categorize skills by type (case-insensitive)"""
+        # Categories keep their declared order, with 'Other' last
+        categorized = {category: [] for category in self.skill_categories}
+        categorized['Other'] = []
         
-        # Add uncategorized skills
-        all_categorized = []
-        for cat_skills in categorized.values():
-            all_categorized.extend(cat_skills)
-        
-        uncategorized = [skill for skill in skills if skill not in all_categorized]
-        if uncategorized:
-            categorized['Other'] = uncategorized
+        for skill in skills:
+            categorized[self._skill_to_category.get(skill.lower(), 'Other')].append(skill)
         
         return {k: v for k, v in categorized.items() if v}  # Remove empty categories
     
     def assess_skill_level(self, skill: str, user_experience: str) -> str:
         """Assess skill level based on experience and market data"""
         # Simple heuristic based on years of experience
-        if 'years' in user_experience.lower():
-            try:
-                years = int(user_experience.split()[0])
-                if years >= 5:
-                    return 'expert'
-                elif years >= 3:
-                    return 'advanced'
-                elif years >= 1:
-                    return 'intermediate'
-                else:
-                    return 'beginner'
-            except:
-                return 'intermediate'
-        
-        return 'intermediate'  # Default
-    
-    def identify_skill_gaps(self, user_skills: List[str], target_role: str = None) -> Dict[str, List[str]]:
-        """Identify missing skills based on market demand"""
-        user_skills_set = set(skill.lower() for skill in user_skills)
+        match = _YEARS_RE.match(user_experience)
+        if not match:
+            return 'intermediate'  # Default
         
-        gaps = {
+        return _LEVELS[bisect_right(_LEVEL_BOUNDS, int(match.group(1)))]
+    
+    def _bucket_market_skills(self) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+        """Market skills as (name, lowercase name), grouped by the gap type they count as when missing"""
+        buckets = {
             'critical_missing': [],
             'emerging_opportunities': [],
             'complementary_skills': []
         }
         
         for skill, data in self.in_demand_skills.items():
-            skill_lower = skill.lower()
-            demand_level = data['demand_level']
-            growth_rate = data['growth_rate']
-            
-            if skill_lower not in user_skills_set:
-                if demand_level >= 85:
-                    gaps['critical_missing'].append(skill)
-                elif growth_rate >= 30:
-                    gaps['emerging_opportunities'].append(skill)
-                else:
-                    gaps['complementary_skills'].append(skill)
-        
-        return gaps
+            if data['demand_level'] >= 85:
+                gap_type = 'critical_missing'
+            elif data['growth_rate'] >= 30:
+                gap_type = 'emerging_opportunities'
+            else:
+                gap_type = 'complementary_skills'
+            buckets[gap_type].append((skill, skill.lower()))
+        
+        return {gap_type: tuple(skills) for gap_type, skills in buckets.items()}
+    
+    def identify_skill_gaps(self, user_skills: List[str], target_role: str = None) -> Dict[str, List[str]]:
+        """Identify missing skills based on market demand"""
+        user_skills_set = _lower_frozenset(tuple(user_skills))
+        
+        # Buckets are fixed at init; only membership depends on the user
+        return {
+            gap_type: [skill for skill, skill_lower in skills if skill_lower not in user_skills_set]
+            for gap_type, skills in self._gap_buckets.items()
+        }
     
     def get_learning_recommendations(self, skill_gaps: Dict[str, List[str]]) -> Dict[str, List[Dict]]:
         """Generate learning recommendations for skill gaps"""
@@ -157,8 +162,20 @@ class SkillMatcherAgent:
     
     def calculate_skill_match_score(self, user_skills: List[str], job_requirements: List[str]) -> Dict:
         """Calculate how well user skills match job requirements"""
-        user_skills_set = set(skill.lower() for skill in user_skills)
-        job_skills_set = set(skill.lower() for skill in job_requirements)
+        return self._match_skill_set(_lower_frozenset(tuple(user_skills)), job_requirements)
+    
+    def calculate_skill_match_scores_batch(self, user_skills: List[str],
+                                           requirements_list: List[List[str]]) -> List[Dict]:
+        """
+        Match one user against several jobs' requirements in a single call
+        Returns one calculate_skill_match_score-style result per requirements list, in order
+        """
+        user_skills_set = _lower_frozenset(tuple(user_skills))
+        return [self._match_skill_set(user_skills_set, job_requirements) for job_requirements in requirements_list]
+    
+    def _match_skill_set(self, user_skills_set: FrozenSet[str], job_requirements: List[str]) -> Dict:
+        """Match result for a pre-lowercased user skill set"""
+        job_skills_set = _lower_frozenset(tuple(job_requirements))
         
         matching_skills = user_skills_set.intersection(job_skills_set)
         missing_skills = job_skills_set - user_skills_set
@@ -4,29 +4,60 @@ Resume Processing Service for Career Coach AI
 Handles PDF/TXT resume parsing and analysis using Flask
 """
 
+import copy
+import hashlib
 import os
+import re
 import tempfile
+import threading
+import time
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from functools import lru_cache
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 import logging
 
+# Configure logging (before the optional imports below, which report through it)
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from flask_compress import Compress
+    FLASK_COMPRESS_AVAILABLE = True
+except ImportError:
+    FLASK_COMPRESS_AVAILABLE = False
+
+# NLTK data pyresparser needs: (resource path, download package)
+NLTK_RESOURCES = (('corpora/stopwords', 'stopwords'), ('tokenizers/punkt', 'punkt'))
+
+def ensure_nltk_data(nltk):
+    """Download missing NLTK data, unless SKIP_NLTK_DOWNLOAD=1 (data provisioned ahead of time)"""
+    skip_download = os.environ.get('SKIP_NLTK_DOWNLOAD') == '1'
+    for resource, package in NLTK_RESOURCES:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            if skip_download:
+                logger.warning(f"NLTK data '{package}' missing and SKIP_NLTK_DOWNLOAD is set")
+            else:
+                nltk.download(package, quiet=True)
+
 # Resume parsing libraries
 try:
     import nltk
-    # Download required NLTK data
-    try:
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('stopwords', quiet=True)
-    
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt', quiet=True)
-        
+    ensure_nltk_data(nltk)
     from pyresparser import ResumeParser
     PYRESPARSER_AVAILABLE = True
 except (ImportError, Exception) as e:
@@ -39,21 +70,81 @@ try:
 except ImportError:
     PDFMINER_AVAILABLE = False
 
+try:
+    import pymupdf  # MuPDF bindings; much faster text extraction than pdfminer
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+from agents.keyword_matcher import KeywordMatcher
+
 app = Flask(__name__)
 CORS(app)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Compress JSON responses above 1KB (job lists carry long descriptions)
+if FLASK_COMPRESS_AVAILABLE:
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    Compress(app)
 
 # Configuration
 UPLOAD_FOLDER = '/tmp/resumes'
-ALLOWED_EXTENSIONS = {'txt', 'pdf', 'docx', 'doc'}
+ALLOWED_EXTENSIONS = frozenset({'txt', 'pdf', 'docx', 'doc'})
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
+# Reject oversized uploads while the request is read, before anything reaches disk
+app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
+
 # Create upload directory
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Basic parser patterns and skill vocabulary, compiled once at import
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'[\+]?[1-9]?[0-9]{7,14}')
+
+TECH_SKILLS = (
+    'Python', 'JavaScript', 'Java', 'C++', 'React', 'Node.js', 'HTML', 'CSS',
+    'SQL', 'MongoDB', 'PostgreSQL', 'Docker', 'AWS', 'Git', 'Linux',
+    'Machine Learning', 'Data Science', 'Angular', 'Vue.js', 'TypeScript',
+    'Express.js', 'Django', 'Flask', 'Spring', 'Kubernetes'
+)
+TECH_SKILL_MATCHER = KeywordMatcher(TECH_SKILLS)  # One pass over the text for all skills
+
+# Shared HTTP session for the Remotive API: keep-alive connection pool plus retries
+# on transient failures (requests already asks for gzip-compressed responses)
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+    pool_connections=4,
+    pool_maxsize=10
+)
+_http_session.mount('https://', _http_adapter)
+_http_session.mount('http://', _http_adapter)
+
+# Successful Remotive responses, keyed by the exact skills list: skills_key -> (expires_at, result)
+JOB_CACHE_TTL = 120  # seconds
+JOB_CACHE_SIZE = 128
+_job_cache = OrderedDict()
+_job_cache_lock = threading.Lock()
+
+# pyresparser results by file content: '<blake2b digest><extension>' -> parsed data.
+# Set RESUME_CACHE_DIR to also keep them on disk, shared across workers and restarts.
+PARSE_CACHE_SIZE = 256
+PARSE_CACHE_DIR = os.environ.get('RESUME_CACHE_DIR')
+_parse_cache = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+def json_response(payload, status=200):
+    """JSON response for payload, encoded with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            # Sorted keys, matching jsonify's output
+            body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            return app.response_class(body, status=status, mimetype='application/json')
+        except TypeError:
+            pass  # Types orjson cannot encode; let Flask's provider handle them
+    return jsonify(payload), status
+
 def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -63,8 +154,14 @@ def extract_text_from_file(file_path, filename):
     try:
         file_ext = filename.rsplit('.', 1)[1].lower()
         
+        if file_ext == 'pdf' and PYMUPDF_AVAILABLE:
+            try:
+                with pymupdf.open(file_path) as doc:
+                    return '\n'.join(page.get_text('text') for page in doc)
+            except Exception as e:
+                logger.warning(f"PyMuPDF could not read {filename}, trying pdfminer: {str(e)}")
+        
         if file_ext == 'pdf' and PDFMINER_AVAILABLE:
-            from pdfminer.high_level import extract_text
             return extract_text(file_path)
         elif file_ext == 'txt':
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -77,14 +174,62 @@ def extract_text_from_file(file_path, filename):
         logger.error(f"Error extracting text: {str(e)}")
         return None
 
+def _resume_cache_key(file_path):
+    """Content hash of the file plus its extension, which selects pyresparser's reader"""
+    with open(file_path, 'rb') as f:
+        digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+    return digest + os.path.splitext(file_path)[1].lower()
+
+def _cached_parse(cache_key):
+    """Private copy of a cached pyresparser result, or None"""
+    with _parse_cache_lock:
+        if cache_key in _parse_cache:
+            _parse_cache.move_to_end(cache_key)
+            return copy.deepcopy(_parse_cache[cache_key])
+    
+    if PARSE_CACHE_DIR:
+        try:
+            with open(os.path.join(PARSE_CACHE_DIR, cache_key + '.json'), encoding='utf-8') as f:
+                parsed = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable resume cache entry: {str(e)}")
+            return None
+        _store_parse(cache_key, parsed, persist=False)
+        return parsed
+    return None
+
+def _store_parse(cache_key, parsed, persist=True):
+    """Remember a pyresparser result, evicting the least recently used entry when full"""
+    with _parse_cache_lock:
+        _parse_cache[cache_key] = copy.deepcopy(parsed)
+        _parse_cache.move_to_end(cache_key)
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    
+    if persist and PARSE_CACHE_DIR:
+        try:
+            os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=PARSE_CACHE_DIR, suffix='.tmp', delete=False, encoding='utf-8') as f:
+                json.dump(parsed, f, default=str)
+            os.replace(f.name, os.path.join(PARSE_CACHE_DIR, cache_key + '.json'))  # Atomic for readers
+        except Exception as e:
+            logger.warning(f"Could not write resume cache entry: {str(e)}")
+
 def parse_resume_with_pyresparser(file_path):
-    """Parse resume using pyresparser library"""
+    """Parse resume using pyresparser library, reusing results for identical files"""
     try:
         if not PYRESPARSER_AVAILABLE:
             return None
-            
+        
+        cache_key = _resume_cache_key(file_path)
+        cached = _cached_parse(cache_key)
+        if cached is not None:
+            return cached
+        
         data = ResumeParser(file_path).get_extracted_data()
-        return {
+        parsed = {
             'name': data.get('name', ''),
             'email': data.get('email', ''),
             'mobile_number': data.get('mobile_number', ''),
@@ -93,40 +238,25 @@ def parse_resume_with_pyresparser(file_path):
             'experience': data.get('experience', []),
             'total_experience': data.get('total_experience', 0)
         }
+        _store_parse(cache_key, parsed)
+        return parsed
     except Exception as e:
         logger.error(f"Error parsing with pyresparser: {str(e)}")
         return None
 
 def parse_resume_basic(text_content):
     """Basic text-based resume parsing as fallback"""
-    import re
+    # Only the first email and phone number are used, so stop scanning at them
+    email = EMAIL_RE.search(text_content)
+    phone = PHONE_RE.search(text_content)
     
-    # Extract email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text_content)
-    
-    # Extract phone numbers
-    phone_pattern = r'[\+]?[1-9]?[0-9]{7,14}'
-    phones = re.findall(phone_pattern, text_content)
-    
-    # Extract potential skills (common tech skills)
-    tech_skills = [
-        'Python', 'JavaScript', 'Java', 'C++', 'React', 'Node.js', 'HTML', 'CSS',
-        'SQL', 'MongoDB', 'PostgreSQL', 'Docker', 'AWS', 'Git', 'Linux',
-        'Machine Learning', 'Data Science', 'Angular', 'Vue.js', 'TypeScript',
-        'Express.js', 'Django', 'Flask', 'Spring', 'Kubernetes'
-    ]
-    
-    found_skills = []
-    text_upper = text_content.upper()
-    for skill in tech_skills:
-        if skill.upper() in text_upper:
-            found_skills.append(skill)
+    # Extract potential skills (common tech skills), in vocabulary order
+    found_skills = TECH_SKILL_MATCHER.find_in(text_content.lower())
     
     return {
         'name': '',  # Hard to extract reliably
-        'email': emails[0] if emails else '',
-        'mobile_number': phones[0] if phones else '',
+        'email': email.group() if email else '',
+        'mobile_number': phone.group() if phone else '',
         'skills': found_skills,
         'education': [],
         'experience': [],
@@ -134,7 +264,26 @@ def parse_resume_basic(text_content):
     }
 
 def fetch_remote_jobs(skills_list=None):
-    """Fetch jobs from Remotive.io API with skill filtering"""
+    """Fetch jobs from Remotive.io API with skill filtering, reusing recent responses"""
+    # Order matters (the first skills become the search terms), so the key is not sorted
+    skills_key = tuple(skills_list or ())
+    now = time.monotonic()
+    with _job_cache_lock:
+        entry = _job_cache.get(skills_key)
+        if entry is not None and entry[0] > now:
+            _job_cache.move_to_end(skills_key)
+            return copy.deepcopy(entry[1])
+    
+    result = _fetch_remote_jobs(skills_list)
+    if result.get('success'):  # Fallback data is not cached, so the API is retried
+        with _job_cache_lock:
+            _job_cache[skills_key] = (now + JOB_CACHE_TTL, copy.deepcopy(result))
+            _job_cache.move_to_end(skills_key)
+            while len(_job_cache) > JOB_CACHE_SIZE:
+                _job_cache.popitem(last=False)
+    return result
+
+def _fetch_remote_jobs(skills_list=None):
     try:
         url = "https://remotive.io/api/remote-jobs"
         params = {}
@@ -145,26 +294,31 @@ def fetch_remote_jobs(skills_list=None):
             search_terms = ' OR '.join(skills_list[:3])  # Limit to avoid long URLs
             params['search'] = search_terms
             
-        response = requests.get(url, params=params, timeout=10)
+        response = _http_session.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             jobs = data.get('jobs', [])
             
+            # One matcher over the user's skills, shared by every job below
+            skill_matcher = KeywordMatcher(skills_list) if skills_list else None
+            
             # Format jobs for our frontend
             formatted_jobs = []
             for job in jobs[:20]:  # Limit to 20 jobs
+                description = job.get('job_description') or ''
                 formatted_job = {
                     'id': str(job.get('id', '')),
                     'title': job.get('job_title', ''),
                     'company': job.get('company_name', ''),
                     'location': 'Remote',
-                    'description': job.get('job_description', '')[:200] + '...' if job.get('job_description') else '',
-                    'requirements': job.get('job_description', ''),
+                    'description': description[:200] + '...' if len(description) > 200 else description,
+                    # Known skills named in the posting, rather than a second copy of its full HTML
+                    'requirements': TECH_SKILL_MATCHER.find_in(description.lower()),
                     'salary': job.get('salary', None),
                     'applyUrl': job.get('url', ''),
                     'postedAt': job.get('publication_date', ''),
-                    'matchScore': calculate_job_match(job, skills_list) if skills_list else 75
+                    'matchScore': calculate_job_match(job, skills_list, skill_matcher) if skills_list else 75
                 }
                 formatted_jobs.append(formatted_job)
             
@@ -180,17 +334,15 @@ def fetch_remote_jobs(skills_list=None):
         logger.error(f"Error fetching from Remotive API: {str(e)}")
         return get_fallback_jobs(skills_list)
 
-def calculate_job_match(job, user_skills):
-    """Calculate job match score based on user skills"""
+def calculate_job_match(job, user_skills, skill_matcher=None):
+    """Calculate job match score based on user skills; pass skill_matcher to reuse one across jobs"""
     if not user_skills:
         return 75
-        
-    job_text = (job.get('job_description', '') + ' ' + job.get('job_title', '')).lower()
-    skill_matches = 0
     
-    for skill in user_skills:
-        if skill.lower() in job_text:
-            skill_matches += 1
+    if skill_matcher is None:
+        skill_matcher = KeywordMatcher(user_skills)
+    job_text = (job.get('job_description', '') + ' ' + job.get('job_title', '')).lower()
+    skill_matches = len(skill_matcher.find_in(job_text))
     
     # Calculate match percentage
     if len(user_skills) > 0:
@@ -248,67 +400,84 @@ def get_fallback_jobs(skills_list=None):
         'message': 'Using fallback data - API unavailable'
     }
 
+# Skill-based career paths, defined once at import
+CAREER_PATHS = {
+    'frontend': {
+        'title': 'Frontend Developer',
+        'description': 'Specialize in user interface development with modern frameworks',
+        'required_skills': ('HTML', 'CSS', 'JavaScript', 'React', 'TypeScript'),
+        'timeline': '6-12 months',
+        'salaryRange': '$60,000 - $120,000',
+        'icon': 'monitor'
+    },
+    'backend': {
+        'title': 'Backend Developer',
+        'description': 'Focus on server-side development and API design',
+        'required_skills': ('Python', 'Node.js', 'SQL', 'MongoDB', 'Express.js'),
+        'timeline': '8-14 months',
+        'salaryRange': '$70,000 - $130,000',
+        'icon': 'server'
+    },
+    'fullstack': {
+        'title': 'Full Stack Developer',
+        'description': 'Master both frontend and backend technologies',
+        'required_skills': ('React', 'Node.js', 'Python', 'SQL', 'Git', 'Docker'),
+        'timeline': '12-18 months',
+        'salaryRange': '$80,000 - $140,000',
+        'icon': 'layers'
+    },
+    'data': {
+        'title': 'Data Scientist',
+        'description': 'Analyze data and build machine learning models',
+        'required_skills': ('Python', 'Machine Learning', 'SQL', 'Statistics', 'Pandas'),
+        'timeline': '10-16 months',
+        'salaryRange': '$90,000 - $150,000',
+        'icon': 'trending-up'
+    }
+}
+
+DEFAULT_CAREER_SKILLS = ('JavaScript', 'HTML', 'CSS')  # Used when no skills are given
+
+# Each path's required skills paired with their lowercase form, and the lowercase set
+_CAREER_PATH_SKILLS = {
+    path_key: tuple((skill, skill.lower()) for skill in path_data['required_skills'])
+    for path_key, path_data in CAREER_PATHS.items()
+}
+_CAREER_PATH_REQUIRED = {
+    path_key: frozenset(skill_lower for _, skill_lower in skills)
+    for path_key, skills in _CAREER_PATH_SKILLS.items()
+}
+
 def generate_career_paths(user_skills):
     """Generate dynamic career paths based on user skills"""
-    
-    # Define skill-based career paths
-    career_paths = {
-        'frontend': {
-            'title': 'Frontend Developer',
-            'description': 'Specialize in user interface development with modern frameworks',
-            'required_skills': ['HTML', 'CSS', 'JavaScript', 'React', 'TypeScript'],
-            'timeline': '6-12 months',
-            'salaryRange': '$60,000 - $120,000',
-            'icon': 'monitor'
-        },
-        'backend': {
-            'title': 'Backend Developer',
-            'description': 'Focus on server-side development and API design',
-            'required_skills': ['Python', 'Node.js', 'SQL', 'MongoDB', 'Express.js'],
-            'timeline': '8-14 months',
-            'salaryRange': '$70,000 - $130,000',
-            'icon': 'server'
-        },
-        'fullstack': {
-            'title': 'Full Stack Developer',
-            'description': 'Master both frontend and backend technologies',
-            'required_skills': ['React', 'Node.js', 'Python', 'SQL', 'Git', 'Docker'],
-            'timeline': '12-18 months',
-            'salaryRange': '$80,000 - $140,000',
-            'icon': 'layers'
-        },
-        'data': {
-            'title': 'Data Scientist',
-            'description': 'Analyze data and build machine learning models',
-            'required_skills': ['Python', 'Machine Learning', 'SQL', 'Statistics', 'Pandas'],
-            'timeline': '10-16 months',
-            'salaryRange': '$90,000 - $150,000',
-            'icon': 'trending-up'
-        }
-    }
-    
+    # Paths depend only on which skills the user has, ignoring case and order
+    return copy.deepcopy(_career_paths_for(frozenset(skill.lower() for skill in user_skills)))
+
+@lru_cache(maxsize=256)
+def _career_paths_for(user_skills_lower):
     # Calculate skill matches for each path
-    user_skills_lower = [skill.lower() for skill in user_skills]
     path_recommendations = []
     
-    for path_key, path_data in career_paths.items():
+    for path_key, path_data in CAREER_PATHS.items():
         required_skills = path_data['required_skills']
-        matching_skills = []
-        missing_skills = []
+        matched = _CAREER_PATH_REQUIRED[path_key] & user_skills_lower
         
-        for skill in required_skills:
-            if skill.lower() in user_skills_lower:
-                matching_skills.append(skill)
-            else:
-                missing_skills.append(skill)
+        # Lists keep the path's skill order; the all/none cases skip the per-skill pass
+        if not matched:
+            matching_skills, missing_skills = [], list(required_skills)
+        elif len(matched) == len(required_skills):
+            matching_skills, missing_skills = list(required_skills), []
+        else:
+            matching_skills = [skill for skill, skill_lower in _CAREER_PATH_SKILLS[path_key] if skill_lower in matched]
+            missing_skills = [skill for skill, skill_lower in _CAREER_PATH_SKILLS[path_key] if skill_lower not in matched]
         
-        match_percentage = (len(matching_skills) / len(required_skills)) * 100
+        match_percentage = (len(matched) / len(required_skills)) * 100
         
         path_recommendations.append({
             'id': f'path-{path_key}',
             'title': path_data['title'],
             'description': path_data['description'],
-            'requiredSkills': required_skills,
+            'requiredSkills': list(required_skills),
             'matchingSkills': matching_skills,
             'missingSkills': missing_skills,
             'matchPercentage': int(match_percentage),
@@ -325,9 +494,10 @@ def generate_career_paths(user_skills):
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return json_response({
         'status': 'healthy',
         'pyresparser': PYRESPARSER_AVAILABLE,
+        'pymupdf': PYMUPDF_AVAILABLE,
         'pdfminer': PDFMINER_AVAILABLE
     })
 
@@ -337,29 +507,31 @@ def parse_resume():
     try:
         # Check if file was uploaded
         if 'resume' not in request.files:
-            return jsonify({'error': 'No file uploaded'}), 400
+            return json_response({'error': 'No file uploaded'}, 400)
         
         file = request.files['resume']
         
-        if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
+        if not file.filename:
+            return json_response({'error': 'No file selected'}, 400)
         
         if not allowed_file(file.filename):
-            return jsonify({'error': 'File type not allowed'}), 400
+            return json_response({'error': 'File type not allowed'}, 400)
         
         # Save file temporarily
-        if not file.filename:
-            return jsonify({'error': 'Invalid filename'}), 400
         filename = secure_filename(file.filename)
-        temp_path = os.path.join(UPLOAD_FOLDER, filename)
-        file.save(temp_path)
+        file_ext = file.filename.rsplit('.', 1)[1].lower()
         
-        try:
+        # Uniquely named and removed on close, even if parsing raises
+        with tempfile.NamedTemporaryFile(dir=UPLOAD_FOLDER, suffix='.' + file_ext) as temp_file:
+            file.save(temp_file)
+            temp_file.flush()
+            temp_path = temp_file.name
+            
             # Extract text content
-            text_content = extract_text_from_file(temp_path, filename)
+            text_content = extract_text_from_file(temp_path, temp_path)
             
             if not text_content:
-                return jsonify({'error': 'Could not extract text from file'}), 400
+                return json_response({'error': 'Could not extract text from file'}, 400)
             
             # Try advanced parsing first
             parsed_data = parse_resume_with_pyresparser(temp_path)
@@ -380,65 +552,58 @@ def parse_resume():
                 'message': 'Resume parsed successfully'
             }
             
-            return jsonify(response_data)
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            return json_response(response_data)
                 
+    except RequestEntityTooLarge:
+        return json_response({'error': f'File too large (max {MAX_FILE_SIZE // (1024 * 1024)}MB)'}, 413)
     except Exception as e:
         logger.error(f"Error parsing resume: {str(e)}")
-        return jsonify({'error': f'Processing error: {str(e)}'}), 500
+        return json_response({'error': f'Processing error: {str(e)}'}, 500)
+
+def skills_arg():
+    """Comma-separated 'skills' query parameter as a tuple of non-empty, stripped names"""
+    raw = request.args.get('skills', '')
+    return tuple(filter(None, (skill.strip() for skill in raw.split(',')))) if raw else ()
 
 @app.route('/jobs', methods=['GET'])
 def get_jobs():
     """Get job recommendations based on skills"""
     try:
-        # Get skills from query parameter
-        skills_param = request.args.get('skills', '')
-        user_skills = [s.strip() for s in skills_param.split(',') if s.strip()] if skills_param else None
-        
         # Fetch jobs from API
-        job_data = fetch_remote_jobs(user_skills)
+        job_data = fetch_remote_jobs(skills_arg())
         
-        return jsonify(job_data)
+        return json_response(job_data)
         
     except Exception as e:
         logger.error(f"Error fetching jobs: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'jobs': [],
             'message': f'Error: {str(e)}'
-        }), 500
+        }, 500)
 
 @app.route('/career-paths', methods=['GET'])
 def get_career_paths():
     """Generate career paths based on user skills"""
     try:
-        # Get skills from query parameter
-        skills_param = request.args.get('skills', '')
-        user_skills = [s.strip() for s in skills_param.split(',') if s.strip()] if skills_param else []
-        
         # If no skills provided, use default set
-        if not user_skills:
-            user_skills = ['JavaScript', 'HTML', 'CSS']  # Default skills
+        user_skills = skills_arg() or DEFAULT_CAREER_SKILLS
         
         career_paths = generate_career_paths(user_skills)
         
-        return jsonify({
+        return json_response({
             'success': True,
             'paths': career_paths,
-            'userSkills': user_skills
+            'userSkills': list(user_skills)
         })
         
     except Exception as e:
         logger.error(f"Error generating career paths: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'paths': [],
             'message': f'Error: {str(e)}'
-        }), 500
+        }, 500)
 
 def calculate_resume_score(parsed_data):
     """Calculate resume completeness score"""
@@ -469,4 +634,5 @@ def calculate_resume_score(parsed_data):
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8000))
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    # Development server; production runs wsgi:app under gunicorn (see start_servers.py)
+    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_DEBUG') == '1')
\ No newline at end of file
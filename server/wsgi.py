@@ -0,0 +1,8 @@
+"""
+WSGI entry point for the resume processing service
+Run with: gunicorn --chdir server -k gthread -w 4 --threads 4 -b 0.0.0.0:8000 wsgi:app
+"""
+
+from resume_processor import app
+
+__all__ = ['app']
@@ -2,42 +2,83 @@
 """
 Startup script to launch both Node.js and Python servers
 """
-import subprocess
+import asyncio
+import importlib.util
 import sys
-import time
-import threading
 import os
+import urllib.request
 
-def start_python_server():
+PYTHON_SERVER_PORT = '8000'
+HEALTH_URL = f'http://localhost:{PYTHON_SERVER_PORT}/health'
+READY_TIMEOUT = 10  # seconds to wait for the Python server before starting Node anyway
+READY_POLL_INTERVAL = 0.1
+
+def python_server_command(port):
+    """Command for the Flask service: gunicorn when installed, else the built-in dev server"""
+    if importlib.util.find_spec('gunicorn') is None:
+        return [sys.executable, 'server/resume_processor.py']
+    workers = 2 * (os.cpu_count() or 1) + 1
+    return [
+        sys.executable, '-m', 'gunicorn',
+        '--chdir', 'server',
+        '-w', str(workers), '-k', 'gthread', '--threads', '4',
+        '-b', f'0.0.0.0:{port}', '--timeout', '60',
+        'wsgi:app'
+    ]
+
+def _health_ok() -> bool:
+    try:
+        with urllib.request.urlopen(HEALTH_URL, timeout=1) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+async def wait_until_ready(process) -> bool:
+    """Poll the Python server's /health until it answers 200, it exits, or the timeout passes"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + READY_TIMEOUT
+    while loop.time() < deadline:
+        if process.returncode is not None:
+            return False
+        if await asyncio.to_thread(_health_ok):
+            return True
+        await asyncio.sleep(READY_POLL_INTERVAL)
+    return False
+
+async def start_python_server():
     """Start the Python Flask server"""
+    print("Starting Python Flask server...")
+    env = os.environ.copy()
+    env['PORT'] = PYTHON_SERVER_PORT
+    return await asyncio.create_subprocess_exec(*python_server_command(PYTHON_SERVER_PORT), env=env)
+
+async def start_node_server():
+    """Start the Node.js Express server"""
+    print("Starting Node.js Express server...")
+    return await asyncio.create_subprocess_exec('npm', 'run', 'dev')
+
+async def main():
+    python_process = None
     try:
-        print("Starting Python Flask server...")
-        env = os.environ.copy()
-        env['PORT'] = '8000'
-        process = subprocess.Popen([
-            sys.executable, 'server/resume_processor.py'
-        ], env=env)
-        process.wait()
+        python_process = await start_python_server()
+        if not await wait_until_ready(python_process):
+            print(f"Python server not healthy after {READY_TIMEOUT}s; starting Node.js anyway")
     except Exception as e:
         print(f"Python server error: {e}")
-
-def start_node_server():
-    """Start the Node.js Express server"""
+    
     try:
-        print("Starting Node.js Express server...")
-        process = subprocess.Popen(['npm', 'run', 'dev'])
-        process.wait()
+        # Node.js runs in the foreground; the script ends when it does
+        node_process = await start_node_server()
+        await node_process.wait()
     except Exception as e:
         print(f"Node.js server error: {e}")
+    finally:
+        if python_process is not None and python_process.returncode is None:
+            python_process.terminate()
+            await python_process.wait()
 
 if __name__ == '__main__':
-    # Start Python server in background
-    python_thread = threading.Thread(target=start_python_server)
-    python_thread.daemon = True
-    python_thread.start()
-    
-    # Give Python server time to start
-    time.sleep(2)
-    
-    # Start Node.js server in foreground
-    start_node_server()
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass